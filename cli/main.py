@@ -31,6 +31,7 @@ High-level pipeline:
 6) actionplan
    - Parse VA methods into ActionPlans in:
        workspace/actionplan/<app_id>_actionplan.json
+   - `actionplan-all` does the same for every app that has va_methods/.
 
 7) pipeline
    - Convenience command that runs steps 2–6 for a single app_id.
@@ -47,6 +48,7 @@ import json
 import os
 import shutil
 import sys
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List
 
@@ -56,33 +58,64 @@ if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
 from configs.settings import settings
-from core.converter.espresso.va_code_generator import process_app_workspace
+
+
+@dataclass(frozen=True)
+class AppPaths:
+    """Workspace paths for one app, joined once per command."""
+
+    input_dir: str
+    extracted_dir: str
+    va_dir: str
+
+
+def _app_paths(workspace_root: str, app_id: str) -> AppPaths:
+    """Build the AppPaths for app_id under workspace_root."""
+    root = os.path.join(workspace_root, app_id)
+    return AppPaths(
+        input_dir=os.path.join(root, "input"),
+        extracted_dir=os.path.join(root, "extracted_tests"),
+        va_dir=os.path.join(root, "va_methods"),
+    )
 
 
 def _count_files(directory: str, extensions: tuple[str, ...]) -> int:
-    """Count files in a directory with given extensions."""
+    """Count files in a directory with given (lowercase) extensions.
+
+    Uses os.scandir so the file-type check comes from the directory listing
+    itself instead of one stat() per entry.
+    """
     if not os.path.isdir(directory):
         return 0
-    return sum(
-        1
-        for fname in os.listdir(directory)
-        if fname.lower().endswith(extensions)
-        and os.path.isfile(os.path.join(directory, fname))
-    )
+    with os.scandir(directory) as it:
+        return sum(
+            1
+            for entry in it
+            if entry.name.lower().endswith(extensions) and entry.is_file()
+        )
 
 
 def _write_json(data: Dict, out_path: str) -> None:
-    """Write JSON to a file with UTF-8 encoding and pretty formatting."""
+    """Write JSON to a file with UTF-8 encoding and pretty formatting.
+
+    The document is serialized in memory and written in one call; json.dump
+    would issue a separate write() for every token.
+    """
     os.makedirs(os.path.dirname(out_path), exist_ok=True)
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write("\n")
+    Path(out_path).write_text(
+        json.dumps(data, indent=2, ensure_ascii=False) + "\n",
+        encoding="utf-8",
+    )
 
 
 def _copy_file(src: str, dest: str) -> None:
-    """Copy a file to dest, creating parent directories if needed."""
+    """Copy a file's contents to dest, creating parent directories if needed.
+
+    Only the data is copied (no permission bits or timestamps), so on Linux
+    shutil.copyfile can hand the transfer to os.sendfile in the kernel.
+    """
     os.makedirs(os.path.dirname(dest), exist_ok=True)
-    shutil.copy2(src, dest)
+    shutil.copyfile(src, dest)
 
 
 # ---------------------------------------------------------------------------
@@ -100,14 +133,13 @@ def cmd_prepare(app_id: str, src_path: str, workspace_root: str) -> None:
     both test classes (e.g., AccessStatisticsTest.java) and optional
     app_introduction.txt files.
     """
-    app_root = os.path.join(workspace_root, app_id)
-    input_dir = os.path.join(app_root, "input")
-    os.makedirs(input_dir, exist_ok=True)
+    paths = _app_paths(workspace_root, app_id)
+    os.makedirs(paths.input_dir, exist_ok=True)
 
     if not os.path.isfile(src_path):
         raise FileNotFoundError(f"Source file not found: {src_path}")
 
-    dest_path = os.path.join(input_dir, os.path.basename(src_path))
+    dest_path = os.path.join(paths.input_dir, os.path.basename(src_path))
 
     print(f"[AVA-Gen] Preparing workspace for app_id={app_id}")
     print(f"[AVA-Gen] ➕ Copying file: {src_path} → {dest_path}")
@@ -120,37 +152,43 @@ def cmd_prepare(app_id: str, src_path: str, workspace_root: str) -> None:
 # ---------------------------------------------------------------------------
 
 
-def cmd_extract(app_id: str, workspace_root: str) -> None:
+def cmd_extract(app_id: str, workspace_root: str, force: bool = False) -> None:
     """
     Extract test methods for a given app_id.
 
     We currently reuse process_app_workspace, which populates both
     extracted_tests/ and va_methods/. Here we focus the output on
-    extracted_tests/.
+    extracted_tests/. With force=True the workspace is re-processed even
+    if it looks unchanged.
     """
-    app_root = os.path.join(workspace_root, app_id)
-    extracted_dir = os.path.join(app_root, "extracted_tests")
+    paths = _app_paths(workspace_root, app_id)
+
+    # Lazy import to avoid pulling converter code when not needed.
+    from core.converter.espresso.va_code_generator import process_app_workspace
 
     print(f"[AVA-Gen] Parsing test scripts for app_id={app_id}...")
-    process_app_workspace(app_id=app_id, workspace_root=workspace_root)
-    test_count = _count_files(extracted_dir, (".java", ".kt"))
-    print(f"[AVA-Gen] ✓ {test_count} test methods extracted → {extracted_dir}")
+    process_app_workspace(app_id=app_id, workspace_root=workspace_root, force=force)
+    test_count = _count_files(paths.extracted_dir, (".java", ".kt"))
+    print(f"[AVA-Gen] ✓ {test_count} test methods extracted → {paths.extracted_dir}")
 
 
-def cmd_generate_va(app_id: str, workspace_root: str) -> None:
+def cmd_generate_va(app_id: str, workspace_root: str, force: bool = False) -> None:
     """
     Generate VA methods for a given app_id.
 
     We reuse process_app_workspace to ensure extracted_tests/ and
-    va_methods/ are in sync, then report VA method count.
+    va_methods/ are in sync, then report VA method count. Right after
+    `extract` (input/ unchanged) the call does no work, unless force=True.
     """
-    app_root = os.path.join(workspace_root, app_id)
-    va_dir = os.path.join(app_root, "va_methods")
+    paths = _app_paths(workspace_root, app_id)
+
+    # Lazy import to avoid pulling converter code when not needed.
+    from core.converter.espresso.va_code_generator import process_app_workspace
 
     print(f"[AVA-Gen] Generating VA methods for app_id={app_id}...")
-    process_app_workspace(app_id=app_id, workspace_root=workspace_root)
-    va_count = _count_files(va_dir, (".java",))
-    print(f"[AVA-Gen] ✓ {va_count} VA methods created → {va_dir}")
+    process_app_workspace(app_id=app_id, workspace_root=workspace_root, force=force)
+    va_count = _count_files(paths.va_dir, (".java",))
+    print(f"[AVA-Gen] ✓ {va_count} VA methods created → {paths.va_dir}")
 
 
 # ---------------------------------------------------------------------------
@@ -214,30 +252,65 @@ def cmd_actionplan(app_id: str, workspace_root: str) -> None:
     generate_action_plans_for_app(app_id=app_id, workspace_root=workspace_root)
 
 
+def cmd_actionplan_all(workspace_root: str) -> None:
+    """
+    Build ActionPlans for every app under workspace_root that has a
+    va_methods/ directory, in a single process.
+
+    Running all apps here (rather than one `ava-gen actionplan` per app)
+    pays interpreter start-up and module import cost only once.
+    """
+    app_ids: List[str] = []
+    if os.path.isdir(workspace_root):
+        app_ids = sorted(
+            name
+            for name in os.listdir(workspace_root)
+            if os.path.isdir(os.path.join(workspace_root, name, "va_methods"))
+        )
+
+    if not app_ids:
+        print(f"[AVA-Gen] No apps with va_methods/ found under {workspace_root}")
+        return
+
+    print(f"[AVA-Gen] Building ActionPlans for {len(app_ids)} apps...")
+    for app_id in app_ids:
+        cmd_actionplan(app_id=app_id, workspace_root=workspace_root)
+
+
 # ---------------------------------------------------------------------------
 # Step 7: pipeline – end-to-end for a single app
 # ---------------------------------------------------------------------------
 
 
-def cmd_pipeline(app_id: str, workspace_root: str, skip_intents: bool) -> None:
+def cmd_pipeline(
+    app_id: str,
+    workspace_root: str,
+    skip_intents: bool,
+    force: bool = False,
+) -> None:
     """
     Run the full pipeline (extract, generate-va, build-skills, build-intents)
-    for a single app_id.
+    for a single app_id. With force=True extraction and VA generation run
+    even if the workspace looks unchanged.
     """
     print(f"[AVA-Gen] Running full pipeline for app_id={app_id}")
 
-    # Extract & VA generation in one go via process_app_workspace
-    app_root = os.path.join(workspace_root, app_id)
-    extracted_dir = os.path.join(app_root, "extracted_tests")
-    va_dir = os.path.join(app_root, "va_methods")
+    # Extract & VA generation in one go via process_app_workspace: a single
+    # call fills both extracted_tests/ and va_methods/ (and is a no-op when
+    # input/ is unchanged since the last run), so both directories are only
+    # counted after it returns.
+    paths = _app_paths(workspace_root, app_id)
+
+    # Lazy import to avoid pulling converter code when not needed.
+    from core.converter.espresso.va_code_generator import process_app_workspace
 
     print("[AVA-Gen] Parsing test scripts...")
-    process_app_workspace(app_id=app_id, workspace_root=workspace_root)
-    test_count = _count_files(extracted_dir, (".java", ".kt"))
+    process_app_workspace(app_id=app_id, workspace_root=workspace_root, force=force)
+    test_count = _count_files(paths.extracted_dir, (".java", ".kt"))
     print(f"[AVA-Gen] ✓ {test_count} test methods extracted")
 
     print("\n[AVA-Gen] Generating VA methods...")
-    va_count = _count_files(va_dir, (".java",))
+    va_count = _count_files(paths.va_dir, (".java",))
     print(f"[AVA-Gen] ✓ {va_count} VA methods created")
 
     print("\n[AVA-Gen] Building JSON skill descriptions...")
@@ -292,12 +365,22 @@ def build_parser() -> argparse.ArgumentParser:
         "extract", help="Extract test methods for an app"
     )
     p_extract.add_argument("app_id", help="App ID (folder name under workspace/)")
+    p_extract.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-process the workspace even if input/ looks unchanged",
+    )
 
     # generate-va
     p_gen_va = subparsers.add_parser(
         "generate-va", help="Generate VA methods for an app"
     )
     p_gen_va.add_argument("app_id", help="App ID (folder name under workspace/)")
+    p_gen_va.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-process the workspace even if input/ looks unchanged",
+    )
 
     # build-skills
     p_skills = subparsers.add_parser(
@@ -312,6 +395,12 @@ def build_parser() -> argparse.ArgumentParser:
     )
     p_actionplan.add_argument("app_id", help="App ID (folder name under workspace/)")
 
+    # actionplan-all
+    subparsers.add_parser(
+        "actionplan-all",
+        help="Build ActionPlans for every app under the workspace that has VA methods",
+    )
+
     # build-intents
     subparsers.add_parser(
         "build-intents",
@@ -329,6 +418,11 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Skip building global intent artifacts",
     )
+    p_pipeline.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-process the workspace even if input/ looks unchanged",
+    )
 
     return parser
 
@@ -348,10 +442,12 @@ def main() -> None:
         )
     elif command == "actionplan":
         cmd_actionplan(app_id=args.app_id, workspace_root=workspace_root)
+    elif command == "actionplan-all":
+        cmd_actionplan_all(workspace_root=workspace_root)
     elif command == "extract":
-        cmd_extract(app_id=args.app_id, workspace_root=workspace_root)
+        cmd_extract(app_id=args.app_id, workspace_root=workspace_root, force=args.force)
     elif command == "generate-va":
-        cmd_generate_va(app_id=args.app_id, workspace_root=workspace_root)
+        cmd_generate_va(app_id=args.app_id, workspace_root=workspace_root, force=args.force)
     elif command == "build-skills":
         cmd_build_skills(app_id=args.app_id, workspace_root=workspace_root)
     elif command == "build-intents":
@@ -361,6 +457,7 @@ def main() -> None:
             app_id=args.app_id,
             workspace_root=workspace_root,
             skip_intents=args.skip_intents,
+            force=args.force,
         )
     else:
         parser.error(f"Unknown command: {command}")
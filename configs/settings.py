@@ -38,6 +38,22 @@ class Settings:
             self._openai_model,
         )
 
+        # Native structured outputs (json_schema response_format) for
+        # Pydantic-typed GPT requests (on unless set to 0)
+        self._openai_structured_outputs = os.getenv(
+            "AVA_GEN_OPENAI_STRUCTURED_OUTPUTS", "1"
+        ).strip().lower() not in ("0", "false", "no", "off")
+
+        # Content-hash cache for parsed ActionPlans (on unless set to 0)
+        self._actionplan_cache = os.getenv(
+            "AVA_GEN_ACTIONPLAN_CACHE", "1"
+        ).strip().lower() not in ("0", "false", "no", "off")
+
+        # Content-hash cache for converted test classes (on unless set to 0)
+        self._convert_cache = os.getenv(
+            "AVA_GEN_CONVERT_CACHE", "1"
+        ).strip().lower() not in ("0", "false", "no", "off")
+
     # ------------------------------------------------------------------
     # OpenAI / model settings
     # ------------------------------------------------------------------
@@ -63,6 +79,10 @@ class Settings:
     def intent_model(self) -> str:
         return self._intent_model
 
+    @property
+    def openai_structured_outputs(self) -> bool:
+        return self._openai_structured_outputs
+
     # ------------------------------------------------------------------
     # Paths
     # ------------------------------------------------------------------
@@ -75,6 +95,18 @@ class Settings:
     def runtime_data_dir(self) -> Path:
         return self._runtime_data_dir
 
+    # ------------------------------------------------------------------
+    # Caching
+    # ------------------------------------------------------------------
+
+    @property
+    def actionplan_cache(self) -> bool:
+        return self._actionplan_cache
+
+    @property
+    def convert_cache(self) -> bool:
+        return self._convert_cache
+
 
 settings = Settings()
 
@@ -18,19 +18,28 @@ We convert them into an ActionPlan with a list of ActionSteps.
 
 from __future__ import annotations
 
+import hashlib
+import logging
 import os
 import re
-from typing import List, Dict, Optional
+import sys
+from functools import lru_cache
+from itertools import islice, repeat
+from typing import Any, Iterator, List, Dict, Optional
 
-
-import json
+from configs.settings import settings
 
 # Reuse the Espresso-side string expression parser so that arguments like
 # equalsIgnoreCase("Save") and containsIgnoreCase("EditText") are
 # interpreted consistently when we build ActionPlan matchers.
 from core.converter.espresso.statement_converter import _parse_string_expr
+from core.converter.espresso import statement_converter, supported_espresso_apis
+from core.utils.fileio import module_source_digest, write_bytes_atomic
+
+from pydantic import BaseModel, TypeAdapter
+
 
-from pydantic import BaseModel
+logger = logging.getLogger(__name__)
 
 
 # ============================================================
@@ -93,6 +102,29 @@ class ActionPlan(BaseModel):
 
 _METHOD_NAME_RE = re.compile(r"public\s+void\s+(\w+)\s*\(")
 
+# findNode(...) wrapper and structural NodeQuery constructs, compiled once
+# because parse_findnode_matchers runs for every targeted VA step.
+_FINDNODE_PREFIX_RE = re.compile(r"^findNode\s*\(")
+_FINDNODE_SUFFIX_RE = re.compile(r"\)\s*;?\s*$")
+_STRUCTURAL_RE = re.compile(r"\b(?:withParent|withChild|hasDescendant)\s*\(")
+
+# Tokens that matter to split_args_preserving_parens: a double-quoted string
+# literal (with backslash escapes, possibly unterminated), or a single
+# parenthesis / comma outside of any literal.
+_ARG_TOKEN_RE = re.compile(r'"(?:[^"\\]|\\.)*"?|[(),]', re.DOTALL)
+
+# Simple (non-structural) view matchers and the Matcher.type they map to.
+_MATCHER_TYPES: Dict[str, str] = {
+    "withId": "id",
+    "withText": "text",
+    "withContentDescription": "contentDescription",
+    "withClassName": "className",
+}
+_SIMPLE_MATCHER_RE = re.compile(
+    r"(withId|withText|withContentDescription|withClassName)\((.*)\)",
+    re.DOTALL,
+)
+
 
 def extract_method_name(va_code: str) -> str:
     """
@@ -102,35 +134,43 @@ def extract_method_name(va_code: str) -> str:
     return m.group(1) if m else "UnknownMethod"
 
 
-def extract_method_body_lines(va_code: str) -> List[str]:
+def iter_method_body_lines(va_code: str) -> Iterator[str]:
     """
-    Extract just the body lines inside the outermost method braces.
+    Yield the body lines inside the outermost method braces, one at a time.
 
-    Assumes exactly one public void method per file.
+    Assumes exactly one public void method per file. Blank lines are
+    skipped. parse_va_method_to_action_plan consumes this directly, so no
+    intermediate list of body lines is built.
+
+    Braces are only counted on lines that contain one (most body lines are
+    single brace-free statements).
     """
     lines = va_code.splitlines()
-    body_lines: List[str] = []
 
-    in_method = False
-    brace_count = 0
+    for header_idx, line in enumerate(lines):
+        if "public void" in line:
+            break
+    else:
+        return
 
-    for line in lines:
-        if not in_method:
-            if "public void" in line:
-                in_method = True
-                brace_count += line.count("{") - line.count("}")
-                continue
-        else:
+    brace_count = line.count("{") - line.count("}")
+
+    for line in islice(lines, header_idx + 1, None):
+        if "{" in line or "}" in line:
             brace_count += line.count("{") - line.count("}")
-            stripped = line.strip()
+        if brace_count <= 0:
+            return
+        if line.strip():
+            yield line
 
-            if brace_count <= 0:
-                break
 
-            if stripped:
-                body_lines.append(line)
+def extract_method_body_lines(va_code: str) -> List[str]:
+    """
+    Extract just the body lines inside the outermost method braces.
 
-    return body_lines
+    List-returning wrapper around iter_method_body_lines.
+    """
+    return list(iter_method_body_lines(va_code))
 
 
 def split_args_preserving_parens(arg_str: str) -> List[str]:
@@ -157,48 +197,30 @@ def split_args_preserving_parens(arg_str: str) -> List[str]:
     NOTE: This is a minimal, purpose-built splitter for our generated VA
     code. It assumes double-quoted string literals and does not attempt
     to fully parse arbitrary Java.
+
+    Rather than walking the input one character at a time, we let
+    `_ARG_TOKEN_RE` jump straight to the structural tokens (parentheses,
+    commas, and whole string literals, escapes included) and emit each
+    argument as a single slice of `arg_str`.
     """
     parts: List[str] = []
-    buf: List[str] = []
     depth = 0
-    in_string = False
-    escape = False
-
-    for ch in arg_str:
-        if in_string:
-            buf.append(ch)
-            if escape:
-                # Previous char was backslash; current char is escaped.
-                escape = False
-            elif ch == "\\":
-                escape = True
-            elif ch == '"':
-                in_string = False
-            continue
-
-        if ch == '"':
-            in_string = True
-            buf.append(ch)
-            continue
+    start = 0
 
+    for m in _ARG_TOKEN_RE.finditer(arg_str):
+        ch = arg_str[m.start()]
         if ch == '(':
             depth += 1
-            buf.append(ch)
-            continue
-        if ch == ')':
+        elif ch == ')':
             depth -= 1
-            buf.append(ch)
-            continue
-
-        if ch == ',' and depth == 0 and not in_string:
-            parts.append("".join(buf).strip())
-            buf = []
-            continue
+        elif ch == ',' and depth == 0:
+            parts.append(arg_str[start:m.start()].strip())
+            start = m.end()
+        # String literals are consumed whole by the regex, so any commas or
+        # parentheses inside them never reach this loop.
 
-        buf.append(ch)
-
-    if buf:
-        parts.append("".join(buf).strip())
+    if start < len(arg_str):
+        parts.append(arg_str[start:].strip())
 
     return parts
 
@@ -218,16 +240,15 @@ def parse_findnode_matchers(findnode_call: str) -> (List[Matcher], str):
     """
     # Strip `findNode(` and trailing `);` or `)`
     inner = findnode_call.strip()
-    inner = re.sub(r"^findNode\s*\(", "", inner)
-    inner = re.sub(r"\)\s*;?\s*$", "", inner).strip()
+    inner = _FINDNODE_PREFIX_RE.sub("", inner, count=1)
+    inner = _FINDNODE_SUFFIX_RE.sub("", inner, count=1).strip()
 
     node_query = inner
 
     # If we detect structural NodeQuery constructs (withParent/withChild/hasDescendant),
     # we should NOT emit flattened matchers. In these cases, the Android client will
     # rely entirely on the full node_query DSL, and matchers are left empty.
-    structural_pattern = r"\b(withParent|withChild|hasDescendant)\s*\("
-    has_structural = re.search(structural_pattern, inner) is not None
+    has_structural = _STRUCTURAL_RE.search(inner) is not None
 
     matchers: List[Matcher] = []
 
@@ -264,32 +285,15 @@ def parse_findnode_matchers(findnode_call: str) -> (List[Matcher], str):
             if not p:
                 continue
 
-            # withId(...)
-            if p.startswith("withId(") and p.endswith(")"):
-                inner_arg = p[len("withId("):-1].strip()
-                value, mode = _parse_string_expr(inner_arg)
-                matchers.append(Matcher(type="id", value=value, mode=mode))
-                continue
-
-            # withText(...)
-            if p.startswith("withText(") and p.endswith(")"):
-                inner_arg = p[len("withText("):-1].strip()
-                value, mode = _parse_string_expr(inner_arg)
-                matchers.append(Matcher(type="text", value=value, mode=mode))
-                continue
-
-            # withContentDescription(...)
-            if p.startswith("withContentDescription(") and p.endswith(")"):
-                inner_arg = p[len("withContentDescription("):-1].strip()
-                value, mode = _parse_string_expr(inner_arg)
-                matchers.append(Matcher(type="contentDescription", value=value, mode=mode))
-                continue
-
-            # withClassName(...)
-            if p.startswith("withClassName(") and p.endswith(")"):
-                inner_arg = p[len("withClassName("):-1].strip()
-                value, mode = _parse_string_expr(inner_arg)
-                matchers.append(Matcher(type="className", value=value, mode=mode))
+            # withId(...), withText(...), withContentDescription(...),
+            # withClassName(...): one anchored match picks the matcher name
+            # and its argument, and _MATCHER_TYPES maps it to the field type.
+            m = _SIMPLE_MATCHER_RE.fullmatch(p)
+            if m:
+                value, mode = _parse_string_expr(m.group(2).strip())
+                matchers.append(
+                    Matcher(type=_MATCHER_TYPES[m.group(1)], value=value, mode=mode)
+                )
                 continue
 
             # If the part is not a simple withX(...) matcher (for example, it is
@@ -304,6 +308,35 @@ def parse_findnode_matchers(findnode_call: str) -> (List[Matcher], str):
 # Line → ActionStep parsing
 # ============================================================
 
+# Argument-free VA calls and the ActionStep action each one maps to.
+#
+# Scrolling accepts both the bare helper call and the ActionPerformer-style
+# helper, e.g. scrollDown(); and performScrollDown();.
+_LITERAL_ACTIONS: Dict[str, str] = {
+    "pressBack()": "pressBack",
+    "closeSoftKeyboard()": "closeSoftKeyboard",
+    "scrollDown()": "scrollDown",
+    "performScrollDown()": "scrollDown",
+    "scrollUp()": "scrollUp",
+    "performScrollUp()": "scrollUp",
+    "swipeLeft50Percent()": "swipeLeft50Percent",
+    "swipeRight50Percent()": "swipeRight50Percent",
+    "performSwipeLeft()": "swipeLeft",
+    "performSwipeRight()": "swipeRight",
+}
+
+# VA calls with an argument, matched in a single pass. Every alternative
+# starts with a distinct call name, so at most one can match; `lastgroup`
+# names the call and that group holds its argument.
+_ACTION_CALL_RE = re.compile(
+    r"Thread\.sleep\((?P<sleep>\d+)\)"
+    r"|performClick\s*\((?P<click>.+)\)"
+    r"|performInput\s*\((?P<input>.+)\)"
+    r"|performSwipeLeftOnNode\s*\((?P<swipeLeftOnNode>.+)\)"
+    r"|performSwipeRightOnNode\s*\((?P<swipeRightOnNode>.+)\)"
+)
+
+
 def parse_action_line(line: str) -> Optional[ActionStep]:
     """
     Parse one VA line into an ActionStep, if possible.
@@ -318,68 +351,32 @@ def parse_action_line(line: str) -> Optional[ActionStep]:
       pressBack();
       closeSoftKeyboard();
       Thread.sleep(1500);
+
+    Steps without a target pass matchers=[] explicitly: pydantic deep-copies
+    the mutable field default on every instantiation, which costs more than
+    validating a fresh empty list.
     """
     stripped = line.strip().rstrip(";").strip()
 
-    # Press back
-    if stripped == "pressBack()":
-        return ActionStep(action="pressBack")
-
-    # Close keyboard
-    if stripped == "closeSoftKeyboard()":
-        return ActionStep(action="closeSoftKeyboard")
-
-    # Scroll down
-    # We support both the bare helper call:
-    #   scrollDown();
-    # and the ActionPerformer-style helper:
-    #   performScrollDown();
-    if stripped in ("scrollDown()", "performScrollDown()"):
-        return ActionStep(action="scrollDown")
-
-    # Scroll up
-    # Similarly, handle both:
-    #   scrollUp();
-    #   performScrollUp();
-    if stripped in ("scrollUp()", "performScrollUp()"):
-        return ActionStep(action="scrollUp")
-
-    # Swipe left 50 percent
-    if stripped == "swipeLeft50Percent()":
-        return ActionStep(action="swipeLeft50Percent")
-
-    # Swipe right 50 percent
-    if stripped == "swipeRight50Percent()":
-        return ActionStep(action="swipeRight50Percent")
-
-    # Sleep
-    m_sleep = re.match(r"Thread\.sleep\((\d+)\)", stripped)
-    if m_sleep:
-        millis = int(m_sleep.group(1))
-        return ActionStep(action="sleep", millis=millis)
-
-    # performSwipeLeft(); / performSwipeRight();
-    if stripped == "performSwipeLeft()":
-        return ActionStep(action="swipeLeft")
-    if stripped == "performSwipeRight()":
-        return ActionStep(action="swipeRight")
-
-    # With findNode target
-    # performClick(...)
-    m_click = re.match(r"performClick\s*\((.+)\)", stripped)
-    if m_click:
-        arg = m_click.group(1).strip()
-        if arg.startswith("findNode("):
-            matchers, node_query = parse_findnode_matchers(arg)
-            return ActionStep(action="click", matchers=matchers, node_query=node_query)
-        else:
-            return ActionStep(action="click")
+    # pressBack(), closeSoftKeyboard(), scrollDown(), performSwipeLeft(), ...
+    literal_action = _LITERAL_ACTIONS.get(stripped)
+    if literal_action is not None:
+        return ActionStep(action=literal_action, matchers=[])
 
-    # performInput(findNode(...), value)
-    m_input = re.match(r"performInput\s*\((.+)\)", stripped)
-    if m_input:
-        args = m_input.group(1).strip()
+    m = _ACTION_CALL_RE.match(stripped)
+    if m is None:
+        # Unknown line pattern → ignore for now
+        return None
+
+    action = m.lastgroup
+    arg = m.group(action).strip()
 
+    # Thread.sleep(1500)
+    if action == "sleep":
+        return ActionStep(action="sleep", matchers=[], millis=int(arg))
+
+    # performInput(findNode(...), value)
+    if action == "input":
         # Use a parenthesis- and string-aware splitter so that nested NodeQuery
         # expressions do not break argument parsing.
         #
@@ -393,7 +390,7 @@ def parse_action_line(line: str) -> Optional[ActionStep]:
         # This should yield:
         #   target_expr = 'findNode(withId("AmountEditText"), withParent(...))'
         #   text_expr   = '"20"'
-        parts = split_args_preserving_parens(args)
+        parts = split_args_preserving_parens(arg)
 
         target_expr = parts[0] if parts else ""
         text_expr = parts[1] if len(parts) > 1 else ""
@@ -402,9 +399,13 @@ def parse_action_line(line: str) -> Optional[ActionStep]:
 
         # Strip quotes around text literal if present so that:
         #   text_expr = "\"20\""  →  text_value = "20"
-        m_text_lit = re.match(r'"(.*)"', text_expr)
-        if m_text_lit:
-            text_value = m_text_lit.group(1)
+        # The value runs from the opening quote to the last quote on the
+        # first line (the same span as re.match(r'"(.*)"')).
+        if text_expr.startswith('"'):
+            line_end = text_expr.find("\n")
+            close = text_expr.rfind('"', 1, line_end if line_end != -1 else len(text_expr))
+            if close != -1:
+                text_value = text_expr[1:close]
 
         if target_expr.startswith("findNode("):
             matchers, node_query = parse_findnode_matchers(target_expr)
@@ -418,31 +419,18 @@ def parse_action_line(line: str) -> Optional[ActionStep]:
             # Input without a findNode; we still keep the text literal.
             return ActionStep(
                 action="input",
+                matchers=[],
                 text=text_value,
             )
 
-    # performSwipeLeftOnNode(findNode(...))
-    m_swipe_left_node = re.match(r"performSwipeLeftOnNode\s*\((.+)\)", stripped)
-    if m_swipe_left_node:
-        arg = m_swipe_left_node.group(1).strip()
-        if arg.startswith("findNode("):
-            matchers, node_query = parse_findnode_matchers(arg)
-            return ActionStep(action="swipeLeftOnNode", matchers=matchers, node_query=node_query)
-        else:
-            return ActionStep(action="swipeLeftOnNode")
-
-    # performSwipeRightOnNode(findNode(...))
-    m_swipe_right_node = re.match(r"performSwipeRightOnNode\s*\((.+)\)", stripped)
-    if m_swipe_right_node:
-        arg = m_swipe_right_node.group(1).strip()
-        if arg.startswith("findNode("):
-            matchers, node_query = parse_findnode_matchers(arg)
-            return ActionStep(action="swipeRightOnNode", matchers=matchers, node_query=node_query)
-        else:
-            return ActionStep(action="swipeRightOnNode")
+    # performClick(...), performSwipeLeftOnNode(...), performSwipeRightOnNode(...)
+    # with an optional findNode target
+    if arg.startswith("findNode("):
+        matchers, node_query = parse_findnode_matchers(arg)
+        return ActionStep(action=action, matchers=matchers, node_query=node_query)
+    else:
+        return ActionStep(action=action, matchers=[])
 
-    # Unknown line pattern → ignore for now
-    return None
 
 
 # ============================================================
@@ -454,11 +442,10 @@ def parse_va_method_to_action_plan(va_code: str) -> ActionPlan:
     Parse a full VA Java method into an ActionPlan.
     """
     method_name = extract_method_name(va_code)
-    body_lines = extract_method_body_lines(va_code)
 
     steps: List[ActionStep] = []
 
-    for line in body_lines:
+    for line in iter_method_body_lines(va_code):
         step = parse_action_line(line)
         if step is not None:
             steps.append(step)
@@ -466,14 +453,99 @@ def parse_va_method_to_action_plan(va_code: str) -> ActionPlan:
     return ActionPlan(method_name=method_name, steps=steps)
 
 
+# ============================================================
+# Content-hash cache for parsed ActionPlans
+# ============================================================
+#
+# Parsing is a pure function of the VA source, so a plan parsed once can be
+# reused on later runs as long as the source is byte-for-byte identical.
+# Entries live under {workspace_root}/.cache/actionplan/<digest>.json.
+
+# Personalization string mixed into every cache key. Parser changes are
+# covered by _parser_version(); bump the tag only if the entry format changes.
+_ACTIONPLAN_CACHE_TAG = b"ava-actionplan-2"
+
+
+@lru_cache(maxsize=None)
+def _parser_version() -> str:
+    """
+    Digest of the modules whose code shapes a parsed ActionPlan (this
+    module and the statement converter it borrows from), computed once per
+    process, so editing the parser invalidates cached plans on its own.
+    """
+    return module_source_digest(
+        (sys.modules[__name__], statement_converter, supported_espresso_apis)
+    )
+
+
+def _actionplan_cache_key(va_code: str) -> str:
+    """Return the cache key (BLAKE2b hex digest) for a VA method source."""
+    return hashlib.blake2b(
+        f"{_parser_version()}\0{va_code}".encode("utf-8"),
+        digest_size=16,
+        person=_ACTIONPLAN_CACHE_TAG,
+    ).hexdigest()
+
+
+def _load_cached_action_plan(cache_dir: str, key: str) -> Optional[ActionPlan]:
+    """Load a cached ActionPlan, or return None on a miss or broken entry."""
+    path = os.path.join(cache_dir, f"{key}.json")
+    try:
+        with open(path, "rb") as f:
+            return ActionPlan.model_validate_json(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def _store_cached_action_plan(cache_dir: str, key: str, plan: ActionPlan) -> None:
+    """Write an ActionPlan to the cache. Failures are ignored (best effort)."""
+    path = os.path.join(cache_dir, f"{key}.json")
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        write_bytes_atomic(path, plan.model_dump_json().encode("utf-8"))
+    except OSError:
+        pass
+
+
 # ============================================================
 # App-level helper: parse all VA methods for an app
 # ============================================================
 
+# Below this many VA files, generate_action_plans_for_app parses serially.
+_PARALLEL_MIN_FILES = 32
+
+# Serializes the app-level ActionPlan file with pydantic-core's native JSON
+# encoder. The bytes are identical to json.dumps(..., indent=2,
+# ensure_ascii=False), only produced without Python-level encoding work.
+_ACTIONPLAN_FILE_ADAPTER = TypeAdapter(Dict[str, Any])
+
+
+def _parse_va_source(va_code: str, cache_dir: Optional[str]) -> Dict[str, Any]:
+    """
+    Parse one VA method source, returning the plan as a plain dict.
+
+    Defined at module level (and returning a dict rather than a Pydantic
+    model) so it can run in a ProcessPoolExecutor worker. The caller reads
+    the file, so workers never touch the va_methods/ directory. When
+    `cache_dir` is given, the content-hash cache is consulted and updated.
+    """
+    plan: Optional[ActionPlan] = None
+    if cache_dir is not None:
+        cache_key = _actionplan_cache_key(va_code)
+        plan = _load_cached_action_plan(cache_dir, cache_key)
+    if plan is None:
+        plan = parse_va_method_to_action_plan(va_code)
+        if cache_dir is not None:
+            _store_cached_action_plan(cache_dir, cache_key, plan)
+    return plan.model_dump()
+
+
 def generate_action_plans_for_app(
     app_id: str,
     *,
     workspace_root: str = "workspace",
+    use_cache: Optional[bool] = None,
+    max_workers: Optional[int] = None,
 ) -> None:
     """
     Parse all VA Java methods under:
@@ -482,6 +554,15 @@ def generate_action_plans_for_app(
 
     Aggregates the parsed action plans and writes them as JSON to:
         {workspace_root}/actionplan/{app_id}_actionplan.json
+
+    Unchanged VA methods are served from the content-hash cache under
+    {workspace_root}/.cache/actionplan/ instead of being parsed again.
+    `use_cache` defaults to settings.actionplan_cache
+    (AVA_GEN_ACTIONPLAN_CACHE).
+
+    Apps with at least _PARALLEL_MIN_FILES VA methods are parsed in a
+    process pool of `max_workers` processes (default: one per CPU); pass
+    max_workers=1 to force serial parsing.
     """
     app_root = os.path.join(workspace_root, app_id)
     va_dir = os.path.join(app_root, "va_methods")
@@ -489,45 +570,87 @@ def generate_action_plans_for_app(
     if not os.path.isdir(va_dir):
         raise FileNotFoundError(f"VA methods directory not found: {va_dir}")
 
-    plans: Dict[str, ActionPlan] = {}
-
-    for fname in os.listdir(va_dir):
-        if not fname.endswith(".java"):
-            continue
-
-        va_path = os.path.join(va_dir, fname)
-        if not os.path.isfile(va_path):
-            continue
-
-        with open(va_path, "r", encoding="utf-8") as f:
-            va_code = f.read()
+    if use_cache is None:
+        use_cache = settings.actionplan_cache
+    cache_dir = os.path.join(workspace_root, ".cache", "actionplan")
+
+    # All VA sources are read here, in one pass, and handed to the parser
+    # (or the pool workers) as strings.
+    # scandir reports the file type from the directory listing itself, so
+    # no extra stat() per entry is needed (except for symlinks).
+    va_sources: List[str] = []
+    with os.scandir(va_dir) as entries:
+        va_files = [
+            entry.path
+            for entry in entries
+            if entry.name.endswith(".java") and entry.is_file()
+        ]
+    for va_path in va_files:
+        # One binary read + decode skips the incremental text-IO decoder.
+        # Newlines are normalized the way text mode would, so parsing and
+        # cache keys stay the same for files written with \r\n.
+        with open(va_path, "rb") as f:
+            va_code = f.read().decode("utf-8")
+        if "\r" in va_code:
+            va_code = va_code.replace("\r\n", "\n").replace("\r", "\n")
+        va_sources.append(va_code)
+
+    # Parsing is CPU-bound and independent per file, so larger apps are
+    # spread over a process pool. Small apps stay serial: spinning up
+    # worker processes costs more than parsing a handful of methods.
+    worker_cache_dir = cache_dir if use_cache else None
+    if max_workers == 1 or len(va_sources) < _PARALLEL_MIN_FILES:
+        results = [_parse_va_source(src, worker_cache_dir) for src in va_sources]
+    else:
+        # Lazy import: concurrent.futures.process is only needed here.
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(
+                executor.map(
+                    _parse_va_source,
+                    va_sources,
+                    repeat(worker_cache_dir),
+                    chunksize=16,
+                )
+            )
 
-        plan = parse_va_method_to_action_plan(va_code)
-        plans[plan.method_name] = plan
-
-        # Debug/logging: summarize parsed action plan for this method
-        print(f"[AVA-Gen] Parsed VA method '{plan.method_name}' with {len(plan.steps)} steps.")
-        for idx, step in enumerate(plan.steps):
-            print(
-                f"  [STEP {idx}] action={step.action} "
-                f"text={step.text!r} "
-                f"node_query={step.node_query!r} "
-                f"matchers={len(step.matchers)}"
+    # Workers return plain dicts (plan.model_dump()) so results pickle cheaply.
+    plans_dict: Dict[str, Dict[str, Any]] = {}
+    debug = logger.isEnabledFor(logging.DEBUG)
+    for plan_dict in results:
+        plans_dict[plan_dict["method_name"]] = plan_dict
+
+        # Per-step summary, only formatted when DEBUG logging is enabled.
+        if debug:
+            steps = plan_dict["steps"]
+            logger.debug(
+                "Parsed VA method '%s' with %d steps.",
+                plan_dict["method_name"],
+                len(steps),
             )
+            for idx, step in enumerate(steps):
+                logger.debug(
+                    "  [STEP %d] action=%s text=%r node_query=%r matchers=%d",
+                    idx,
+                    step["action"],
+                    step["text"],
+                    step["node_query"],
+                    len(step["matchers"]),
+                )
 
     # Prepare output directory
     out_dir = os.path.join(workspace_root, "actionplan")
     os.makedirs(out_dir, exist_ok=True)
     out_path = os.path.join(out_dir, f"{app_id}_actionplan.json")
 
-    # Serialize plans as plain dicts
-    plans_dict = {method: plan.model_dump() for method, plan in plans.items()}
     output_obj = {
         "app_id": app_id,
         "action_plans": plans_dict,
     }
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(output_obj, f, indent=2, ensure_ascii=False)
+    # Serialized in memory and swapped in atomically: an interrupted run
+    # leaves the previous ActionPlan file intact instead of a truncated one.
+    write_bytes_atomic(out_path, _ACTIONPLAN_FILE_ADAPTER.dump_json(output_obj, indent=2))
     print(f"[AVA-Gen] Action plans written to: {out_path}")
 
 
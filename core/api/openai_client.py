@@ -10,11 +10,14 @@ Used by:
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import json
-from typing import Any, Optional, Type, Union
+import re
+from typing import Any, Callable, List, Optional, Type, Union
 
 from pydantic import BaseModel
-from openai import OpenAI, OpenAIError
+from openai import AsyncOpenAI, OpenAI, OpenAIError
 
 from configs.settings import settings
 
@@ -29,6 +32,13 @@ client = OpenAI(
     base_url=settings.openai_base_url,
 )
 
+# Async counterpart for callers that already run an event loop
+# (see async_send_request_to_gpt).
+async_client = AsyncOpenAI(
+    api_key=settings.openai_api_key,
+    base_url=settings.openai_base_url,
+)
+
 # Default model for AVA-Gen (customizable via AVA_GEN_OPENAI_MODEL)
 DEFAULT_MODEL = settings.openai_model
 
@@ -37,6 +47,43 @@ DEFAULT_MODEL = settings.openai_model
 # Internal helpers
 # -------------------------------------------------------------------
 
+# Characters that can change brace depth or string state in JSON text.
+_JSON_STRUCTURE_RE = re.compile(r'[{}"\\]')
+
+
+def _balanced_brace_end(text: str, start: int, end: int) -> int:
+    """
+    Return the index of the '}' closing the object opened at text[start],
+    or -1 if it is not closed before `end`.
+
+    Braces inside string literals (including escaped quotes) are ignored.
+    Only the structural characters are visited; the regex skips over
+    everything else in C.
+    """
+    depth = 0
+    in_string = False
+    skip_until = -1
+    for m in _JSON_STRUCTURE_RE.finditer(text, start, end):
+        i = m.start()
+        if i < skip_until:
+            continue
+        c = text[i]
+        if in_string:
+            if c == "\\":
+                skip_until = i + 2
+            elif c == '"':
+                in_string = False
+        elif c == '"':
+            in_string = True
+        elif c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth == 0:
+                return i
+    return -1
+
+
 
 def _extract_json_from_text(text: str) -> str:
     """
@@ -45,25 +92,106 @@ def _extract_json_from_text(text: str) -> str:
     Handles common patterns like Markdown ```json fenced blocks and
     extra prose around the JSON object by extracting the first JSON-like
     block from the text.
+
+    Works on indices into the stripped text: the fence lines are skipped
+    and the {...} block is sliced out once, without splitting the reply
+    into lines and joining them again. The block ends at the brace that
+    balances the first '{', so prose or a second object after it is not
+    swallowed; if the braces never balance, it runs to the last '}'.
     """
     text = text.strip()
+    start, end = 0, len(text)
 
-    # Strip Markdown code fences if present.
+    # Strip Markdown code fences if present: skip the opening ``` line and,
+    # if the remaining text ends with one, the closing ``` line.
     if text.startswith("```"):
-        lines = text.splitlines()
-        if lines and lines[0].startswith("```"):
-            lines = lines[1:]
-        if lines and lines[-1].startswith("```"):
-            lines = lines[:-1]
-        text = "\n".join(lines).strip()
+        first_nl = text.find("\n")
+        start = end if first_nl == -1 else first_nl + 1
+        last_line_start = text.rfind("\n", start) + 1 or start
+        if start < end and text.startswith("```", last_line_start):
+            end = last_line_start
 
     # Best-effort extraction of the first {...} block.
-    if "{" in text and "}" in text:
-        start = text.find("{")
-        end = text.rfind("}")
-        if start != -1 and end != -1 and end > start:
-            return text[start : end + 1].strip()
+    brace_start = text.find("{", start, end)
+    if brace_start != -1:
+        brace_end = _balanced_brace_end(text, brace_start, end)
+        if brace_end == -1:
+            brace_end = text.rfind("}", brace_start, end)
+        if brace_end != -1:
+            return text[brace_start : brace_end + 1]
+
+    return text[start:end].strip()
+
+
+def _completions_parse(
+    api_client: Union[OpenAI, AsyncOpenAI, None] = None,
+) -> Optional[Callable[..., Any]]:
+    """
+    Return the SDK's structured-output helper (chat.completions.parse), or
+    None if the installed openai package predates it.
+
+    Older 1.x releases only expose it as client.beta.chat.completions.parse.
+    """
+    api_client = api_client or client
+    parse = getattr(api_client.chat.completions, "parse", None)
+    if parse is None:
+        beta_chat = getattr(getattr(api_client, "beta", None), "chat", None)
+        parse = getattr(getattr(beta_chat, "completions", None), "parse", None)
+    return parse
+
+
+def _wants_model(structured_output: Union[bool, Type[BaseModel]]) -> bool:
+    return isinstance(structured_output, type) and issubclass(
+        structured_output, BaseModel
+    )
+
+
+def _handle_completion(
+    completion: Any,
+    structured_output: Union[bool, Type[BaseModel]],
+    parsed: bool,
+) -> Any:
+    """
+    Turn a chat completion into the value send_request_to_gpt returns.
+
+    `parsed` tells whether the request went through chat.completions.parse
+    (structured outputs), in which case the SDK already validated the reply.
+    Shared by the sync and async entry points.
+    """
+    if not completion.choices:
+        raise RuntimeError("Empty response from OpenAI API.")
+
+    message = completion.choices[0].message
+
+    # Structured outputs: the SDK already validated the reply into the model.
+    if parsed:
+        if message.parsed is not None:
+            return message.parsed
+        if getattr(message, "refusal", None):
+            raise RuntimeError(f"Model refused the structured request: {message.refusal}")
+
+    text = message.content or ""
+
+    # Case 1: caller just wants raw text
+    if structured_output is False:
+        return text
+
+    # Case 2: caller wants JSON but will handle parsing
+    if structured_output is True:
+        return text
 
+    # Case 3: caller passed a Pydantic model type for structured output
+    if _wants_model(structured_output):
+        # We expect the model to output JSON; normalize and try to parse it
+        cleaned_text = _extract_json_from_text(text)
+        try:
+            data = json.loads(cleaned_text)
+        except json.JSONDecodeError as e:
+            raise RuntimeError(f"Failed to parse JSON from model output: {e}\nRaw text: {text}")
+
+        return structured_output(**data)
+
+    # Fallback: unknown structured_output type
     return text
 
 
@@ -88,7 +216,10 @@ def send_request_to_gpt(
         - False (default): return plain text string.
         - True: expect a JSON object and return raw text (caller parses).
         - Pydantic BaseModel subclass: ask the model to fill that schema and
-          return an instance of that model.
+          return an instance of that model. Unless
+          AVA_GEN_OPENAI_STRUCTURED_OUTPUTS=0, the schema is sent as a
+          json_schema response_format so the API returns schema-valid JSON;
+          otherwise the JSON object is extracted from the reply text.
     model : str, optional
         Override the default model name.
 
@@ -106,43 +237,141 @@ def send_request_to_gpt(
         If response is missing or malformed.
     """
     model_name = model or DEFAULT_MODEL
+    messages = [
+        {"role": "user", "content": prompt},
+    ]
+    parse = (
+        _completions_parse()
+        if _wants_model(structured_output) and settings.openai_structured_outputs
+        else None
+    )
 
     # Basic chat-style call with a single user message
     try:
-        completion = client.chat.completions.create(
-            model=model_name,
-            messages=[
-                {"role": "user", "content": prompt},
-            ],
-            temperature=0.0,
-        )
+        if parse is not None:
+            completion = parse(
+                model=model_name,
+                messages=messages,
+                response_format=structured_output,
+                temperature=0.0,
+            )
+        else:
+            completion = client.chat.completions.create(
+                model=model_name,
+                messages=messages,
+                temperature=0.0,
+            )
     except OpenAIError as e:
         # Re-raise for now; you can log or wrap this later
         raise e
 
-    if not completion.choices:
-        raise RuntimeError("Empty response from OpenAI API.")
+    return _handle_completion(completion, structured_output, parse is not None)
 
-    text = completion.choices[0].message.content or ""
 
-    # Case 1: caller just wants raw text
-    if structured_output is False:
-        return text
+async def _async_send(
+    api_client: AsyncOpenAI,
+    prompt: str,
+    *,
+    structured_output: Union[bool, Type[BaseModel]],
+    model: Optional[str],
+    semaphore: Optional[asyncio.Semaphore],
+) -> Any:
+    model_name = model or DEFAULT_MODEL
+    messages = [
+        {"role": "user", "content": prompt},
+    ]
+    parse = (
+        _completions_parse(api_client)
+        if _wants_model(structured_output) and settings.openai_structured_outputs
+        else None
+    )
+
+    # The semaphore only bounds how many requests are in flight at once.
+    async with (semaphore or contextlib.nullcontext()):
+        if parse is not None:
+            completion = await parse(
+                model=model_name,
+                messages=messages,
+                response_format=structured_output,
+                temperature=0.0,
+            )
+        else:
+            completion = await api_client.chat.completions.create(
+                model=model_name,
+                messages=messages,
+                temperature=0.0,
+            )
+
+    return _handle_completion(completion, structured_output, parse is not None)
+
+
+async def async_send_request_to_gpt(
+    prompt: str,
+    *,
+    structured_output: Union[bool, Type[BaseModel]] = False,
+    model: Optional[str] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> Any:
+    """
+    Async version of send_request_to_gpt, using the shared AsyncOpenAI client.
 
-    # Case 2: caller wants JSON but will handle parsing
-    if structured_output is True:
-        return text
+    Takes the same arguments and returns the same values. Pass a shared
+    `semaphore` to cap how many of these run concurrently, e.g. when
+    gathering many of them at once.
+    """
+    return await _async_send(
+        async_client,
+        prompt,
+        structured_output=structured_output,
+        model=model,
+        semaphore=semaphore,
+    )
+
+
+async def _gather(
+    prompts: List[str],
+    concurrency: int,
+    structured_output: Union[bool, Type[BaseModel]],
+    model: Optional[str],
+) -> List[Any]:
+    semaphore = asyncio.Semaphore(concurrency)
+    # A client scoped to this event loop: asyncio.run() closes the loop when
+    # it returns, so pooled connections must not outlive it.
+    async with AsyncOpenAI(
+        api_key=settings.openai_api_key,
+        base_url=settings.openai_base_url,
+    ) as api_client:
+        return await asyncio.gather(
+            *[
+                _async_send(
+                    api_client,
+                    prompt,
+                    structured_output=structured_output,
+                    model=model,
+                    semaphore=semaphore,
+                )
+                for prompt in prompts
+            ]
+        )
 
-    # Case 3: caller passed a Pydantic model type for structured output
-    if isinstance(structured_output, type) and issubclass(structured_output, BaseModel):
-        # We expect the model to output JSON; normalize and try to parse it
-        cleaned_text = _extract_json_from_text(text)
-        try:
-            data = json.loads(cleaned_text)
-        except json.JSONDecodeError as e:
-            raise RuntimeError(f"Failed to parse JSON from model output: {e}\nRaw text: {text}")
 
-        return structured_output(**data)
+def send_many(
+    prompts: List[str],
+    *,
+    concurrency: int = 8,
+    structured_output: Union[bool, Type[BaseModel]] = False,
+    model: Optional[str] = None,
+) -> List[Any]:
+    """
+    Send several prompts concurrently and return the responses in order.
 
-    # Fallback: unknown structured_output type
-    return text
+    At most `concurrency` requests are in flight at a time. Each response is
+    what send_request_to_gpt would return for that prompt. The first failing
+    request raises.
+
+    Must be called from synchronous code (it runs its own event loop); use
+    async_send_request_to_gpt from async code instead.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    return asyncio.run(_gather(list(prompts), concurrency, structured_output, model))
@@ -3,6 +3,14 @@ from typing import List
 
 ESPRESSO_ENTRYPOINTS = ("onView(", "onData(", "onWebView(")
 
+# Any Espresso entry point, so a line is tested with one regex search instead
+# of one substring scan per entry point.
+_ENTRY_RE = re.compile("|".join(map(re.escape, ESPRESSO_ENTRYPOINTS)))
+
+# Normalization patterns, compiled once for all extracted calls.
+_WS_RE = re.compile(r"\s+")
+_PERFORM_RE = re.compile(r"\)\s*\.perform\s*\(")
+
 
 def extract_espresso_calls_from_java_source(source: str) -> List[str]:
     """
@@ -16,6 +24,7 @@ def extract_espresso_calls_from_java_source(source: str) -> List[str]:
     buffer: List[str] = []
     collecting = False
     paren_balance = 0
+    seen_perform = False
 
     for line in lines:
         stripped = line.strip()
@@ -24,12 +33,13 @@ def extract_espresso_calls_from_java_source(source: str) -> List[str]:
 
         if not collecting:
             # Look for start of an Espresso expression
-            if any(ep in stripped for ep in ESPRESSO_ENTRYPOINTS):
+            if _ENTRY_RE.search(stripped):
                 collecting = True
                 buffer = [stripped]
                 paren_balance = stripped.count("(") - stripped.count(")")
+                seen_perform = ".perform(" in stripped
                 # If everything is on one line already
-                if ".perform(" in stripped and stripped.rstrip().endswith(");") and paren_balance <= 0:
+                if seen_perform and stripped.endswith(");") and paren_balance <= 0:
                     calls.append(normalize_java_espresso_call(" ".join(buffer)))
                     collecting = False
                     buffer = []
@@ -37,10 +47,14 @@ def extract_espresso_calls_from_java_source(source: str) -> List[str]:
             # We are collecting continuation lines of the same Espresso call
             buffer.append(stripped)
             paren_balance += stripped.count("(") - stripped.count(")")
-            joined = " ".join(buffer)
+            if ".perform(" in stripped:
+                seen_perform = True
 
             # Heuristic end: we saw .perform( and expression ends with ');
-            if ".perform(" in joined and joined.rstrip().endswith(");") and paren_balance <= 0:
+            # (".perform(" has no space, so it can never straddle two joined
+            # lines; checking each line avoids re-joining the buffer per line.)
+            if seen_perform and stripped.endswith(");") and paren_balance <= 0:
+                joined = " ".join(buffer)
                 calls.append(normalize_java_espresso_call(joined))
                 collecting = False
                 buffer = []
@@ -54,10 +68,10 @@ def normalize_java_espresso_call(raw: str) -> str:
     Espresso structure. This prepares the string for statement_converter.
     """
     # Collapse internal whitespace
-    s = re.sub(r"\s+", " ", raw).strip()
+    s = _WS_RE.sub(" ", raw).strip()
 
     # Ensure single spaces around .perform if you like (optional)
-    s = re.sub(r"\)\s*\.perform\s*\(", ").perform(", s)
+    s = _PERFORM_RE.sub(").perform(", s)
 
     # Ensure trailing semicolon
     if not s.endswith(";"):
@@ -3,6 +3,14 @@ from typing import List
 
 ESPRESSO_ENTRYPOINTS = ("onView(", "onData(", "onWebView(")
 
+# Any Espresso entry point, so a line is tested with one regex search instead
+# of one substring scan per entry point.
+_ENTRY_RE = re.compile("|".join(map(re.escape, ESPRESSO_ENTRYPOINTS)))
+
+# Normalization patterns, compiled once for all extracted calls.
+_WS_RE = re.compile(r"\s+")
+_PERFORM_RE = re.compile(r"\)\s*\.perform\s*\(")
+
 
 def extract_espresso_calls_from_kotlin_source(source: str) -> List[str]:
     """
@@ -25,7 +33,7 @@ def extract_espresso_calls_from_kotlin_source(source: str) -> List[str]:
             continue
 
         if not collecting:
-            if any(ep in stripped for ep in ESPRESSO_ENTRYPOINTS):
+            if _ENTRY_RE.search(stripped):
                 collecting = True
                 buffer = [stripped]
                 paren_balance = stripped.count("(") - stripped.count(")")
@@ -58,10 +66,10 @@ def normalize_kotlin_espresso_call(raw: str) -> str:
     trailing semicolon so it fits the Java-style regex in statement_converter.
     """
     # Remove trailing commas (if any in chained calls)
-    s = re.sub(r"\s+", " ", raw).strip()
+    s = _WS_RE.sub(" ", raw).strip()
 
     # Normalize '.perform(' spacing
-    s = re.sub(r"\)\s*\.perform\s*\(", ").perform(", s)
+    s = _PERFORM_RE.sub(").perform(", s)
 
     # Kotlin usually has no semicolons; add one for the converter
     if not s.endswith(";"):
@@ -31,7 +31,8 @@ included in SUPPORTED_MATCHERS so validation passes.
 """
 
 import re
-from typing import List
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
 
 
 from core.converter.espresso.supported_espresso_apis import (
@@ -78,7 +79,7 @@ HELPER_MODE_NORMALIZATION = {
     "endsWithIgnoreCase": "endsWithIgnoreCase",
 }
 
-STRING_HELPER_MATCHERS = {
+STRING_HELPER_MATCHERS = frozenset({
     "equalsIgnoreCase",
     "equals",
     "containsIgnoreCase",
@@ -86,7 +87,11 @@ STRING_HELPER_MATCHERS = {
     "contains",
     "startsWithIgnoreCase",
     "endsWithIgnoreCase",
-}
+})
+
+# Names accepted in the onView(...) part by validate_espresso_statement(...):
+# view matchers plus the nested string helpers, in one set.
+_VALID_MATCHER_NAMES = SUPPORTED_MATCHERS | STRING_HELPER_MATCHERS
 
 # ---------------------------------------------------------------------------
 # String expression helpers for nested matchers like withText(equalsIgnoreCase("Save"))
@@ -109,6 +114,62 @@ STRING_HELPER_MATCHERS = {
 # same parsing logic.
 TEXT_CALL_RE = re.compile(r'withText\(\s*(?P<arg>[^)]+)\s*\)')
 
+# Test suites repeat the same statements and matcher arguments many times
+# (e.g. the same onView(...).perform(click()) in every test method), so
+# the pure string -> result steps below are memoized with this many entries.
+_STATEMENT_CACHE_SIZE = 4096
+
+# ---------------------------------------------------------------------------
+# Precompiled patterns
+# ---------------------------------------------------------------------------
+#
+# Every statement goes through several of these, so they are compiled once
+# here instead of going through re's pattern cache on each call.
+
+# helperName("value") and bare "value" arguments (see _parse_string_expr).
+_STRING_HELPER_CALL_RE = re.compile(r'(\w+)\(\s*"([^"]+)"\s*\)$')
+_STRING_LITERAL_RE = re.compile(r'"([^"]+)"')
+
+# Function names called in a matcher / action expression.
+_CALL_NAME_RE = re.compile(r"(\w+)\(")
+
+_THREAD_SLEEP_RE = re.compile(r"\s*Thread\.sleep\(\d+\);\s*")
+
+# Conversion rewrites used by convert_espresso_to_findNode(...).
+_IGNORED_MATCHER_RE = re.compile(
+    rf",?\s*({'|'.join(map(re.escape, sorted(IGNORED_MATCHERS)))})\(\)"
+)
+# Substrings every _IGNORED_MATCHER_RE match contains. Probing for them is
+# much cheaper than a regex pass that finds nothing: the optional ',\s*'
+# prefix makes the engine retry at every position.
+_IGNORED_MATCHER_PROBES = tuple(f"{name}()" for name in sorted(IGNORED_MATCHERS))
+# `ViewMatchers.` prefixes and withId(R.id.X) / withId(android.R.id.X),
+# rewritten in one pass by _rewrite_view_matcher(...).
+_VIEW_MATCHER_REWRITE_RE = re.compile(
+    r"ViewMatchers\.|withId\((?:android\.)?R\.id\.(\w+)\)"
+)
+# Tokens that _flatten_allOf_and_rename_on_view(...) acts on.
+_STRUCTURE_TOKEN_RE = re.compile(r"allOf\(|onView\(|[()]")
+_TEXT_ACTION_RE = re.compile(r"(?:replaceText|typeText)\(([^)]+)\)")
+
+# perform(...) actions with a fixed VA translation, keyed by the stripped
+# action text (see _convert_statement_parts).
+_ROOT_ON_VIEW = "onView(isRoot())"
+_ROOT_ACTION_STATEMENTS = {
+    "swipeLeft()": "performSwipeLeft();",
+    "swipeRight()": "performSwipeRight();",
+}
+_NODE_ACTION_CALLS = {
+    "click()": "performClick",
+    "swipeLeft()": "performSwipeLeftOnNode",
+    "swipeRight()": "performSwipeRightOnNode",
+}
+
+# Whitespace normalization (see _normalize_whitespace).
+_WS_RUN_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
 def _parse_string_expr(expr: str):
     """
     Parse a Java-style string expression used inside withText(...) / withId(...).
@@ -142,7 +203,7 @@ def _parse_string_expr(expr: str):
     #
     # We then look up helperName in STRING_HELPER_MATCHERS and normalize
     # it via HELPER_MODE_NORMALIZATION.
-    m = re.match(r'(\w+)\(\s*"([^"]+)"\s*\)$', expr)
+    m = _STRING_HELPER_CALL_RE.match(expr)
     if m:
         helper_name = m.group(1)
         value = m.group(2)
@@ -152,7 +213,7 @@ def _parse_string_expr(expr: str):
             return value, mode
 
     # bare literal: "Save"
-    m = re.match(r'"([^"]+)"', expr)
+    m = _STRING_LITERAL_RE.match(expr)
     if m:
         # Default mode for plain literals – here we choose containsIgnoreCase
         # so that "Save" will match "save", "SAVE", etc.
@@ -166,72 +227,155 @@ def _parse_string_expr(expr: str):
 # Helpers for allOf(...) flattening and whitespace normalization
 # ---------------------------------------------------------------------------
 
-def _flatten_allOf_once(expr: str) -> str:
+def _flatten_allOf_and_rename_on_view(expr: str) -> str:
     """
-    Replace a single occurrence of allOf(A, B, ...) with its arguments: A, B, ...
+    Replace every allOf(A, B, ...) with its arguments: A, B, ... and rename
+    onView( to findNode(, in a single scan.
 
-    This version is robust to nested parentheses inside the arguments.
-    """
-    pattern = "allOf("
-    i = 0
-    out: List[str] = []
-
-    while i < len(expr):
-        j = expr.find(pattern, i)
-        if j == -1:
-            out.append(expr[i:])
-            break
+    Nested allOf(...) calls are flattened too. This is robust to nested
+    parentheses inside the arguments: a stack records, for each open
+    parenthesis, whether it belongs to an allOf( call, so that its matching
+    ')' is dropped and all other parentheses are kept. The kept segments are
+    joined once at the end.
 
-        # text before allOf(
-        out.append(expr[i:j])
+    The rename follows _rewrite_on_view(...) as if it ran on the flattened
+    text: after a rename, further onView( are left alone up to the next
+    kept ')', and a rename with no kept ')' after it is undone.
 
-        # find matching ')' for this allOf(
-        k = j + len(pattern)
-        depth = 1
-        while k < len(expr) and depth > 0:
-            ch = expr[k]
-            if ch == "(":
-                depth += 1
-            elif ch == ")":
-                depth -= 1
-            k += 1
-
-        inner = expr[j + len(pattern) : k - 1]  # inside allOf(...)
-        out.append(inner)
-        i = k  # continue after ')'
+    An allOf( that is never closed keeps everything after it. Input without
+    allOf( goes straight to _rewrite_on_view(...).
+    """
+    if "allOf(" not in expr:
+        return _rewrite_on_view(expr)
 
+    out: List[str] = []
+    stack: List[bool] = []  # True for an allOf( paren, False for any other
+    pos = 0  # start of the segment not yet copied to `out`
+    pending_rename = -1  # index in `out` of a "findNode(" awaiting its ')'
+
+    for m in _STRUCTURE_TOKEN_RE.finditer(expr):
+        start = m.start()
+        c = expr[start]
+        if c == "(":
+            stack.append(False)
+        elif c == ")":
+            if stack and stack.pop():
+                # closing paren of an allOf(...): cut it out
+                out.append(expr[pos:start])
+                pos = start + 1
+            else:
+                pending_rename = -1
+        elif c == "a":
+            # "allOf(": cut it out, remember to drop its ')'
+            out.append(expr[pos:start])
+            pos = m.end()
+            stack.append(True)
+        else:
+            # "onView(": a regular paren, renamed unless one is pending
+            stack.append(False)
+            if pending_rename == -1:
+                out.append(expr[pos:start])
+                pending_rename = len(out)
+                out.append("findNode(")
+                pos = m.end()
+
+    if pending_rename != -1:
+        out[pending_rename] = "onView("
+    out.append(expr[pos:])
     return "".join(out)
 
 
-def _flatten_allOf(expr: str) -> str:
-    """
-    Repeatedly flatten allOf(...) until none remain.
-    """
-    while "allOf(" in expr:
-        expr = _flatten_allOf_once(expr)
-    return expr
-
-
 def _normalize_whitespace(expr: str) -> str:
     """
     Normalize whitespace to avoid ugly double spaces or space-before-paren
     issues, while keeping the expression semantics intact.
+
+    Only the collapse needs the regex engine: afterwards every run is a
+    single space (including the one after each comma), so the trims around
+    parentheses and semicolons are literal str.replace calls.
     """
     # Collapse multi-space sequences
-    expr = re.sub(r"\s+", " ", expr)
+    expr = _WS_RUN_RE.sub(" ", expr)
 
-    # Trim around parentheses and commas
-    expr = re.sub(r"\(\s+", "(", expr)
-    expr = re.sub(r"\s+\)", ")", expr)
-    expr = re.sub(r",\s+", ", ", expr)
-
-    # Remove redundant spaces before semicolons
-    expr = re.sub(r"\s+;", ";", expr)
+    # Trim around parentheses and remove spaces before semicolons
+    expr = expr.replace("( ", "(").replace(" )", ")").replace(" ;", ";")
 
     # Final trim
     return expr.strip()
 
 
+def _rewrite_view_matcher(m: re.Match) -> str:
+    """sub() callback for _VIEW_MATCHER_REWRITE_RE."""
+    id_name = m.group(1)
+    if id_name is None:
+        return ""  # ViewMatchers. prefix
+    return f'withId("{id_name}")'
+
+
+def _rewrite_on_view(expr: str) -> str:
+    """
+    Rename onView( calls to findNode(, keeping their arguments as they are.
+
+    Equivalent to re.sub(r"onView\((.*?)\)", r"findNode(\1)", expr) on
+    single-line input: the lazy group is written back unchanged, so the
+    arguments and closing ')' need no balancing, however deeply the
+    matchers are nested. Like the regex, an onView( with no ')' after it
+    is left alone, and the scan resumes after the first ')' following each
+    rewritten call.
+    """
+    out: List[str] = []
+    pos = 0
+    while True:
+        start = expr.find("onView(", pos)
+        if start == -1:
+            break
+        close = expr.find(")", start + 7)
+        if close == -1:
+            break
+        out.append(expr[pos:start])
+        out.append("findNode(")
+        out.append(expr[start + 7 : close + 1])
+        pos = close + 1
+    if not out:
+        return expr
+    out.append(expr[pos:])
+    return "".join(out)
+
+
+# ---------------------------------------------------------------------------
+# Statement splitting
+# ---------------------------------------------------------------------------
+
+_PERFORM_MARKER = ".perform("
+
+
+def _split_espresso_statement(stmt: str) -> Optional[Tuple[str, str]]:
+    """
+    Split 'onView(...).perform(...);' into (on_view_part, perform_part).
+
+    Same result as re.match(r"(.+?)\.perform\((.+?)\);", stmt).groups():
+    the matcher part runs up to the first '.perform(' (not at index 0) and
+    the action part up to the first ');' after at least one character.
+    Neither part may span a newline. Returns None if there is no match.
+
+    Done with two str.find calls instead of the lazy regex, which retried
+    every prefix of the statement.
+    """
+    p = stmt.find(_PERFORM_MARKER, 1)
+    if p == -1:
+        return None
+    start = p + len(_PERFORM_MARKER)
+    q = stmt.find(");", start + 1)
+    if q == -1:
+        return None
+    # '.' in the regex does not match '\n'. Later candidates only end
+    # further right, so if this one spans a newline, none can match.
+    nl = stmt.find("\n", 0, q)
+    if nl != -1:
+        return None
+    return stmt[:p], stmt[start:q]
+
+
 # ---------------------------------------------------------------------------
 # Validation
 # ---------------------------------------------------------------------------
@@ -270,16 +414,48 @@ def validate_espresso_statement(espresso_statement: str) -> bool:
     stmt = espresso_statement.strip()
 
     # Split into `onView(...)` and `.perform(...)` parts.
-    match = re.match(r"(.+?)\.perform\((.+?)\);", stmt)
-    if not match:
+    parts = _split_espresso_statement(stmt)
+    if parts is None:
         raise ValueError(
             f"Invalid Espresso format. Expected 'onView(...).perform(...);' but got: {espresso_statement}"
         )
 
-    on_view_part, perform_part = match.groups()
+    return _validate_statement_parts(*parts)
 
-    # Extract matcher function names from onView(...)
-    matchers: List[str] = re.findall(r"(\w+)\(", on_view_part)
+
+def _validate_statement_parts(on_view_part: str, perform_part: str) -> bool:
+    """
+    validate_espresso_statement(...) on an already split statement, so that
+    convert_espresso_statement(...) can split once for both steps.
+    """
+    unsupported_matchers, unsupported_actions = _unsupported_call_names(
+        on_view_part, perform_part
+    )
+    if unsupported_matchers:
+        raise UnsupportedMatcherException(list(unsupported_matchers))
+    if unsupported_actions:
+        raise UnsupportedActionException(list(unsupported_actions))
+    return True
+
+
+@lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def _unsupported_call_names(
+    on_view_part: str, perform_part: str
+) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Return (unsupported matcher names, unsupported action names).
+
+    Both are empty for a valid statement. Actions are only checked when all
+    matchers are supported, matching the order in which the exceptions are
+    raised. Results are memoized; lru_cache would not cache a raise, so the
+    exceptions are raised by the caller.
+    """
+    # Extract matcher function names from onView(...). onView(isRoot()) is
+    # common and only names supported matchers, so it skips the scan.
+    if on_view_part == _ROOT_ON_VIEW:
+        matchers: List[str] = []
+    else:
+        matchers = _CALL_NAME_RE.findall(on_view_part)
 
     # The regex above will also pick up nested string helper calls used
     # *inside* matchers, e.g.:
@@ -296,20 +472,18 @@ def validate_espresso_statement(espresso_statement: str) -> bool:
     # validated against SUPPORTED_MATCHERS. The nested helpers such as
     # equalsIgnoreCase(...) are handled later by the Android-side DSL
     # (NodeQuery + StringMatcher) and must NOT cause validation failure.
-    unsupported_matchers = [
-        m for m in matchers
-        if m not in SUPPORTED_MATCHERS and m not in STRING_HELPER_MATCHERS
-    ]
-    if unsupported_matchers:
-        raise UnsupportedMatcherException(unsupported_matchers)
+    #
+    # Most statements are valid, so check them all at once first and only
+    # collect the offenders (for the exception message) when that fails.
+    if not _VALID_MATCHER_NAMES.issuperset(matchers):
+        return tuple(m for m in matchers if m not in _VALID_MATCHER_NAMES), ()
 
     # Extract action function names from perform(...)
-    actions: List[str] = re.findall(r"(\w+)\(", perform_part)
-    unsupported_actions = [a for a in actions if a not in SUPPORTED_ACTIONS]
-    if unsupported_actions:
-        raise UnsupportedActionException(unsupported_actions)
+    actions: List[str] = _CALL_NAME_RE.findall(perform_part)
+    if not SUPPORTED_ACTIONS.issuperset(actions):
+        return (), tuple(a for a in actions if a not in SUPPORTED_ACTIONS)
 
-    return True
+    return (), ()
 
 
 def validate_non_espresso_statement(statement: str) -> bool:
@@ -345,7 +519,7 @@ def validate_non_espresso_statement(statement: str) -> bool:
         return True
 
     # Allow generic `Thread.sleep(<number>);` calls.
-    if re.fullmatch(r"\s*Thread\.sleep\(\d+\);\s*", stmt):
+    if _THREAD_SLEEP_RE.fullmatch(stmt):
         return True
 
     return False
@@ -411,19 +585,35 @@ def convert_espresso_to_findNode(espresso_statement: str) -> str:
     stmt = espresso_statement.strip()
 
     # Split into matcher part and action part
-    match = re.match(r"(.+?)\.perform\((.+?)\);", stmt)
-    if not match:
+    parts = _split_espresso_statement(stmt)
+    if parts is None:
         # Non-fatal: return explicit error string so callers can log/inspect.
         return f"Error: Invalid Espresso input format: {espresso_statement}"
 
-    on_view_part, perform_part = match.groups()
+    return _convert_statement_parts(*parts)
+
+
+@lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def _convert_statement_parts(on_view_part: str, perform_part: str) -> str:
+    """
+    convert_espresso_to_findNode(...) on an already split statement, so that
+    convert_espresso_statement(...) can split once for both steps.
+
+    Memoized: the output depends only on the two parts.
+    """
+    # Root-level swipes, onView(isRoot()).perform(swipeLeft()), have a fixed
+    # translation: return it before running the matcher rewrites.
+    if on_view_part == _ROOT_ON_VIEW:
+        root_statement = _ROOT_ACTION_STATEMENTS.get(perform_part.strip())
+        if root_statement is not None:
+            return root_statement
 
     # Special handling for root-level statements using isRoot()
     is_root_statement = "isRoot()" in on_view_part
 
     # Remove ignored matcher such as 'isDisplayed()' occurrences from matcher chain
-    ignored_regex = "|".join(IGNORED_MATCHERS)
-    on_view_part = re.sub(rf",?\s*({ignored_regex})\(\)", "", on_view_part)
+    if any(probe in on_view_part for probe in _IGNORED_MATCHER_PROBES):
+        on_view_part = _IGNORED_MATCHER_RE.sub("", on_view_part)
 
     # ------------------------------------------------------------------
     # Remove all `ViewMatchers.` prefixes to produce cleaner VA matchers
@@ -432,67 +622,57 @@ def convert_espresso_to_findNode(espresso_statement: str) -> str:
     #   ViewMatchers.withContentDescription("X") → withContentDescription("X")
     # Espresso allows both withId(...) and ViewMatchers.withId(...).
     # Our VA DSL only wants the raw matcher function.
+    #
+    # The same pass converts view IDs:
+    #   withId(R.id.X)         -> withId("X")
+    #   withId(android.R.id.X) -> withId("X")
     # ------------------------------------------------------------------
-    on_view_part = on_view_part.replace("ViewMatchers.", "")
-    
-    # Convert withId(R.id.X) -> withId("X")
-    on_view_part = re.sub(r"withId\(R\.id\.(\w+)\)", r'withId("\1")', on_view_part)
+    if "ViewMatchers." in on_view_part or "R.id." in on_view_part:
+        on_view_part = _VIEW_MATCHER_REWRITE_RE.sub(_rewrite_view_matcher, on_view_part)
 
-    # Convert withId(android.R.id.X) -> withId("X")
-    on_view_part = re.sub(r"withId\(android\.R\.id\.(\w+)\)", r'withId("\1")', on_view_part)
-
-    # Flatten allOf(A, B, ...) -> A, B, ...
-    on_view_part = _flatten_allOf(on_view_part)
-
-    # Replace outermost onView(...) with findNode(...)
-    on_view_part = re.sub(r"onView\((.*?)\)", r"findNode(\1)", on_view_part)
+    # Flatten allOf(A, B, ...) -> A, B, ... and replace the outermost
+    # onView(...) with findNode(...), in one pass
+    on_view_part = _flatten_allOf_and_rename_on_view(on_view_part)
 
     # Normalize matcher expression whitespace
     on_view_part = _normalize_whitespace(on_view_part)
 
     # === Action mapping ===
 
-    # Text input (typeText / replaceText)
-    text_match = re.search(r"(?:replaceText|typeText)\(([^)]+)\)", perform_part)
-    if text_match:
-        text_value = text_match.group(1)
-        # Do NOT add quotes here; variables / function calls should remain valid.
-        converted = f"performInput({on_view_part}, {text_value});"
-        return _normalize_whitespace(converted)
+    # Text input (typeText / replaceText), anywhere in the perform(...) part.
+    # Both names end in "Text(", which is probed before running the regex.
+    if "Text(" in perform_part:
+        text_match = _TEXT_ACTION_RE.search(perform_part)
+        if text_match:
+            text_value = text_match.group(1)
+            # Do NOT add quotes here; variables / function calls should remain valid.
+            converted = f"performInput({on_view_part}, {text_value});"
+            return _normalize_whitespace(converted)
+
+    action = perform_part.strip()
 
     # Scroll actions
     # For now we normalize any onView(...).perform(scrollTo()) to a simple
     # screen-level scroll down, regardless of the specific matcher. In most
     # tests this pattern is just used to bring a widget into view; the real
     # click or input is a separate statement.
-    if perform_part.strip() == "scrollTo()":
-        converted = "performScrollDown();"
-        return _normalize_whitespace(converted)
+    if action == "scrollTo()":
+        return "performScrollDown();"
 
     # Root-level actions (isRoot())
     if is_root_statement:
-        action = perform_part.strip()
-        if action == "swipeLeft()":
-            return "performSwipeLeft();"
-        if action == "swipeRight()":
-            return "performSwipeRight();"
+        root_statement = _ROOT_ACTION_STATEMENTS.get(action)
+        if root_statement is not None:
+            return root_statement
         # Fallback for other root-level actions (if any in the future)
         converted = f"performOnRoot({action});"
         return _normalize_whitespace(converted)
 
-    # Node-level click
-    if perform_part.strip() == "click()":
-        converted = f"performClick({on_view_part});"
-        return _normalize_whitespace(converted)
-
-    # Node-level swipes
-    if perform_part.strip() == "swipeLeft()":
-        converted = f"performSwipeLeftOnNode({on_view_part});"
-        return _normalize_whitespace(converted)
-
-    if perform_part.strip() == "swipeRight()":
-        converted = f"performSwipeRightOnNode({on_view_part});"
-        return _normalize_whitespace(converted)
+    # Node-level click and swipes. on_view_part is already normalized and
+    # wrapping it adds no whitespace, so no second normalization pass.
+    node_call = _NODE_ACTION_CALLS.get(action)
+    if node_call is not None:
+        return f"{node_call}({on_view_part});"
 
     # Fallback: keep structure but with converted findNode(...)
     converted = f"{on_view_part}.perform({perform_part});"
@@ -508,6 +688,9 @@ def convert_espresso_statement(espresso_statement: str) -> str:
       1. validate_espresso_statement(...)
       2. convert_espresso_to_findNode(...)
 
+    The statement is split into its onView(...) and perform(...) parts
+    once, and both steps work on those parts.
+
     Parameters
     ----------
     espresso_statement : str
@@ -527,8 +710,71 @@ def convert_espresso_statement(espresso_statement: str) -> str:
     ValueError
         If the statement format is invalid.
     """
-    validate_espresso_statement(espresso_statement)
-    return convert_espresso_to_findNode(espresso_statement)
+    parts = _split_espresso_statement(espresso_statement.strip())
+    if parts is None:
+        raise ValueError(
+            f"Invalid Espresso format. Expected 'onView(...).perform(...);' but got: {espresso_statement}"
+        )
+
+    _validate_statement_parts(*parts)
+    return _convert_statement_parts(*parts)
+
+
+def convert_espresso_statements(
+    espresso_statements: Iterable[str],
+    *,
+    strict: bool = True,
+) -> List[Optional[str]]:
+    """
+    Batch version of convert_espresso_statement(...), e.g. for all Espresso
+    calls extracted from one test file.
+
+    Parameters
+    ----------
+    espresso_statements : Iterable[str]
+        Normalized Espresso statement strings.
+    strict : bool
+        True (default): raise on the first invalid statement, exactly like
+        convert_espresso_statement(...).
+        False: invalid statements yield None in the result instead, so the
+        output stays aligned with the input.
+
+    Returns
+    -------
+    List[Optional[str]]
+        Converted VA-style statements, in input order.
+
+    Raises
+    ------
+    UnsupportedMatcherException, UnsupportedActionException, ValueError
+        Only when strict is True; see convert_espresso_statement(...).
+    """
+    # Bound once for the whole batch.
+    split = _split_espresso_statement
+    unsupported = _unsupported_call_names
+    convert = _convert_statement_parts
+
+    results: List[Optional[str]] = []
+    append = results.append
+    for espresso_statement in espresso_statements:
+        parts = split(espresso_statement.strip())
+        if parts is None:
+            if strict:
+                raise ValueError(
+                    f"Invalid Espresso format. Expected 'onView(...).perform(...);' but got: {espresso_statement}"
+                )
+            append(None)
+            continue
+
+        unsupported_matchers, unsupported_actions = unsupported(*parts)
+        if unsupported_matchers or unsupported_actions:
+            if strict:
+                _validate_statement_parts(*parts)  # raises the matching exception
+            append(None)
+            continue
+
+        append(convert(*parts))
+    return results
 
 
 if __name__ == "__main__":
@@ -1,16 +1,19 @@
 # supported_espresso_apis.py
 
+# These sets are fixed at import time (frozensets) so that derived lookup
+# tables built from them, e.g. in statement_converter, cannot go stale.
+
 # Define the set of supported non-Espresso method names
-SUPPORTED_NON_ESPRESSO = {
+SUPPORTED_NON_ESPRESSO = frozenset({
     "closeSoftKeyboard()",
     "closeSoftKeyboard();",
     "pressBack()",
     "pressBack();"
 
-}
+})
 
 
-IGNORED_MATCHERS = {
+IGNORED_MATCHERS = frozenset({
 
     "isDisplayed",
     "isNotChecked",
@@ -19,10 +22,10 @@ IGNORED_MATCHERS = {
     "isNotEnabled",
     
     "containsString"
-}
+})
 
 # Example lists of supported matchers and actions from espresso APIs
-SUPPORTED_MATCHERS = {
+SUPPORTED_MATCHERS = frozenset({
     "onView",
     "allOf",
     "withId",
@@ -35,12 +38,12 @@ SUPPORTED_MATCHERS = {
 
     "isRoot",
     "containsStringIgnoringCase",
-}
+})
 
 # Append ignored matchers so validator will accept them
 SUPPORTED_MATCHERS |= IGNORED_MATCHERS
 
-SUPPORTED_ACTIONS = {
+SUPPORTED_ACTIONS = frozenset({
     "click",
     "swipeLeft",
     "swipeRight",
@@ -48,5 +51,5 @@ SUPPORTED_ACTIONS = {
     "typeText",
     "longClick",
     "scrollTo"
-}
+})
 
@@ -12,20 +12,37 @@ workspace/
 
 from __future__ import annotations
 
+import hashlib
+import json
 import os
 import re
-from typing import Dict, List
-
-from core.converter.espresso.java_extractor import (
-    extract_espresso_calls_from_java_source,
-)
-from core.converter.espresso.kotlin_extractor import (
-    extract_espresso_calls_from_kotlin_source,
+import sys
+from functools import lru_cache
+from itertools import repeat
+from typing import Dict, List, Optional, Tuple
+
+from configs.settings import settings
+from exceptions import exceptions as converter_exceptions
+from core.converter.espresso import (
+    java_extractor,
+    kotlin_extractor,
+    statement_converter,
+    supported_espresso_apis,
 )
 from core.converter.espresso.statement_converter import (
     convert_espresso_statement,
     validate_non_espresso_statement,
 )
+from core.utils.fileio import module_source_digest, write_bytes_atomic
+
+
+# Patterns used per test method / header line, compiled once at import.
+_JAVA_HEADER_RE = re.compile(r"public\s+void\s+(\w+)\s*\(")
+_KOTLIN_HEADER_RE = re.compile(r"fun\s+(\w+)\s*\(")
+# Allow an optional `throws ...` clause between parameter list and `{`
+_RENAME_JAVA_RE = re.compile(r"(public\s+void\s+)(\w+)(\s*\([^)]*\)\s*(?:throws\s+[^{]+)?\s*\{)")
+_RENAME_KOTLIN_RE = re.compile(r"(fun\s+)(\w+)(\s*\([^)]*\)\s*\{)")
+_INDENT_RE = re.compile(r"^(\s*)")
 
 
 # ---------------------------------------------------------------------------
@@ -45,124 +62,155 @@ def detect_language_from_path(path: str) -> str:
 # Step 1: Extract @Test methods from a Java/Kotlin class source
 # ---------------------------------------------------------------------------
 
-def split_test_methods_from_java_source(source: str) -> Dict[str, str]:
-    lines = source.splitlines()
-    methods: Dict[str, str] = {}
+# Whitespace-only lines.
+_BLANK_LINES_RE = re.compile(r"(?:[^\S\n]*\n)*")
+# Line breaks str.splitlines() knows besides "\n".
+_OTHER_LINE_BREAK_RE = re.compile(r"[\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029]")
+_OTHER_ASCII_LINE_BREAKS = ("\r", "\x0b", "\x0c", "\x1c", "\x1d", "\x1e")
 
-    i = 0
-    n = len(lines)
-    while i < n:
-        line = lines[i].strip()
-        if line == "@Test":
-            header_index = i + 1
-            while header_index < n and not lines[header_index].strip():
-                header_index += 1
-            if header_index >= n:
-                break
 
-            header_line = lines[header_index]
-            m = re.search(r"public\s+void\s+(\w+)\s*\(", header_line)
-            if not m:
-                i = header_index + 1
-                continue
+def _has_other_line_breaks(source: str) -> bool:
+    # `in` for the ASCII ones is much faster than a regex scan; the regex
+    # is only needed when the source contains non-ASCII text.
+    if not source.isascii():
+        return _OTHER_LINE_BREAK_RE.search(source) is not None
+    return any(c in source for c in _OTHER_ASCII_LINE_BREAKS)
 
-            method_name = m.group(1)
 
-            if "{" not in header_line:
-                body_start_index = header_index + 1
-                while body_start_index < n and "{" not in lines[body_start_index]:
-                    body_start_index += 1
-                if body_start_index >= n:
-                    break
-            else:
-                body_start_index = header_index
+def _line_end(source: str, pos: int) -> int:
+    end = source.find("\n", pos)
+    return len(source) if end == -1 else end
 
-            brace_count = 0
-            method_end_index = body_start_index
-            while method_end_index < n:
-                brace_count += lines[method_end_index].count("{")
-                brace_count -= lines[method_end_index].count("}")
-                if brace_count == 0:
-                    break
-                method_end_index += 1
 
-            method_lines = lines[i : method_end_index + 1]
-            methods[method_name] = "\n".join(method_lines)
+def _split_test_methods(source: str, header_re: re.Pattern) -> Dict[str, str]:
+    """
+    Split a test class into {method_name: method_source}, one entry per
+    @Test method whose header (the next non-blank line) matches header_re.
 
-            i = method_end_index + 1
-        else:
-            i += 1
+    Each method runs from its @Test line to the first line after which the
+    braces counted from its body's first line are balanced.
 
-    return methods
+    The source is walked by character offset with str.find instead of
+    stripping every line and counting braces line by line.
+    """
+    if _has_other_line_breaks(source):
+        # Same lines as splitlines(), joined with "\n" so offsets line up.
+        source = "\n".join(source.splitlines())
+        n = last = len(source)
+    else:
+        n = len(source)
+        # A trailing "\n" does not start another line (as in splitlines()).
+        last = n - 1 if source.endswith("\n") else n
+    methods: Dict[str, str] = {}
 
+    pos = 0
+    while True:
+        at = source.find("@Test", pos)
+        if at == -1:
+            break
+        test_start = source.rfind("\n", 0, at) + 1
+        test_end = _line_end(source, at)
+        if source[test_start:test_end].strip() != "@Test":
+            pos = at + 5
+            continue
 
-def split_test_methods_from_kotlin_source(source: str) -> Dict[str, str]:
-    lines = source.splitlines()
-    methods: Dict[str, str] = {}
+        header_start = _BLANK_LINES_RE.match(source, test_end + 1).end()
+        header_end = _line_end(source, header_start)
+        if header_start >= n or source[header_start:header_end].isspace():
+            break
+
+        m = header_re.search(source, header_start, header_end)
+        if not m:
+            pos = header_end + 1
+            continue
 
-    i = 0
-    n = len(lines)
-    while i < n:
-        line = lines[i].strip()
-        if line == "@Test":
-            header_index = i + 1
-            while header_index < n and not lines[header_index].strip():
-                header_index += 1
-            if header_index >= n:
+        method_name = m.group(1)
+
+        body_open = source.find("{", header_start)
+        if body_open == -1:
+            break
+        body_line_start = source.rfind("\n", 0, body_open) + 1
+
+        # Braces are compared at line ends: balanced_line_end is the end of
+        # the current line while the count is at zero, -1 otherwise.
+        depth = 0
+        balanced_line_end = _line_end(source, body_line_start)
+        next_open = body_open
+        next_close = source.find("}", body_line_start)
+        while True:
+            if next_open != -1 and (next_close == -1 or next_open < next_close):
+                brace = next_open
+            elif next_close != -1:
+                brace = next_close
+            else:
+                break
+            if balanced_line_end != -1 and brace > balanced_line_end:
                 break
+            if brace == next_open:
+                depth += 1
+                next_open = source.find("{", brace + 1)
+            else:
+                depth -= 1
+                next_close = source.find("}", brace + 1)
+            balanced_line_end = -1 if depth else _line_end(source, brace)
 
-            header_line = lines[header_index]
-            m = re.search(r"fun\s+(\w+)\s*\(", header_line)
-            if not m:
-                i = header_index + 1
-                continue
+        # Never balanced: the method runs to the end of the source.
+        method_end = balanced_line_end if balanced_line_end != -1 else last
+        methods[method_name] = source[test_start:method_end]
 
-            method_name = m.group(1)
+        pos = method_end + 1
 
-            if "{" not in header_line:
-                body_start_index = header_index + 1
-                while body_start_index < n and "{" not in lines[body_start_index]:
-                    body_start_index += 1
-                if body_start_index >= n:
-                    break
-            else:
-                body_start_index = header_index
+    return methods
 
-            brace_count = 0
-            method_end_index = body_start_index
-            while method_end_index < n:
-                brace_count += lines[method_end_index].count("{")
-                brace_count -= lines[method_end_index].count("}")
-                if brace_count == 0:
-                    break
-                method_end_index += 1
 
-            method_lines = lines[i : method_end_index + 1]
-            methods[method_name] = "\n".join(method_lines)
+def split_test_methods_from_java_source(source: str) -> Dict[str, str]:
+    return _split_test_methods(source, _JAVA_HEADER_RE)
 
-            i = method_end_index + 1
-        else:
-            i += 1
 
-    return methods
+def split_test_methods_from_kotlin_source(source: str) -> Dict[str, str]:
+    return _split_test_methods(source, _KOTLIN_HEADER_RE)
 
 
 # ---------------------------------------------------------------------------
 # Step 2: Convert a single test method to a VA method
 # ---------------------------------------------------------------------------
 
+def _drop_test_suffix(match: re.Match) -> str:
+    """re.sub callback for _RENAME_JAVA_RE / _RENAME_KOTLIN_RE."""
+    prefix, name, suffix = match.groups()
+    if name.endswith("Test"):
+        name = name[:-4]
+    return f"{prefix}{name}{suffix}"
+
+
+def _rename_header(header_line: str, rename_re: re.Pattern) -> str:
+    # Without "Test" anywhere in the line there is no suffix to drop.
+    if "Test" not in header_line:
+        return header_line
+    return rename_re.sub(_drop_test_suffix, header_line)
+
+
 def rename_method_without_test_suffix(header_line: str) -> str:
-    def repl(match: re.Match) -> str:
-        prefix = match.group(1)
-        name = match.group(2)
-        suffix = match.group(3)
-        if name.endswith("Test"):
-            name = name[:-4]
-        return f"{prefix}{name}{suffix}"
+    return _rename_header(header_line, _RENAME_JAVA_RE)
+
+
+# The same statements (e.g. `onView(withId(R.id.save)).perform(click());`)
+# recur across the test methods of an app; see _convert_joined_statement.
+_CONVERTED_STATEMENT_CACHE_SIZE = 4096
 
-    # Allow an optional `throws ...` clause between parameter list and `{`
-    pattern = r"(public\s+void\s+)(\w+)(\s*\([^)]*\)\s*(?:throws\s+[^{]+)?\s*\{)"
-    return re.sub(pattern, repl, header_line)
+
+@lru_cache(maxsize=_CONVERTED_STATEMENT_CACHE_SIZE)
+def _convert_joined_statement(joined: str) -> str:
+    """
+    convert_espresso_statement(joined), or "" if it raises.
+
+    Memoised, so a repeated statement is split, validated and converted
+    only once, including the ones that are rejected.
+    """
+    try:
+        return convert_espresso_statement(joined)
+    except Exception:
+        return ""
 
 
 def generate_va_method_from_test_method(
@@ -193,25 +241,12 @@ def generate_va_method_from_test_method(
     if language == "java":
         new_header_line = rename_method_without_test_suffix(header_line)
     else:
-        def repl_fun(match: re.Match) -> str:
-            prefix = match.group(1)
-            name = match.group(2)
-            suffix = match.group(3)
-            if name.endswith("Test"):
-                name = name[:-4]
-            return f"{prefix}{name}{suffix}"
-        new_header_line = re.sub(r"(fun\s+)(\w+)(\s*\([^)]*\)\s*\{)", repl_fun, header_line)
+        new_header_line = _rename_header(header_line, _RENAME_KOTLIN_RE)
 
     cleaned_lines[header_index] = new_header_line
-    cleaned_source = "\n".join(cleaned_lines)
-
-    if language == "java":
-        espresso_calls = extract_espresso_calls_from_java_source(cleaned_source)
-    else:
-        espresso_calls = extract_espresso_calls_from_kotlin_source(cleaned_source)
 
     # build VA method body, preserving original statement order
-    header_indent_match = re.match(r"^(\s*)", new_header_line)
+    header_indent_match = _INDENT_RE.match(new_header_line)
     header_indent = header_indent_match.group(1) if header_indent_match else ""
     stmt_indent = header_indent + "    "
 
@@ -220,16 +255,17 @@ def generate_va_method_from_test_method(
 
     body_started = "{" in new_header_line
     collecting = False
-    buffer: List[str] = []
+    buffer: List[str] = []  # stripped lines of the statement being collected
     paren_balance = 0
+    # Tracked per line instead of re-joining the buffer: whether the
+    # statement so far contains ".perform(" and ends with ");".
+    perform_seen = False
+    ends_with_call = False
 
     def flush_buffer() -> None:
         nonlocal collecting, buffer, paren_balance
-        joined = " ".join(line.strip() for line in buffer)
-        try:
-            converted = convert_espresso_statement(joined)
-        except Exception:
-            converted = ""
+        joined = " ".join(buffer)
+        converted = _convert_joined_statement(joined)
         if converted and not converted.startswith("Error:"):
             va_lines.append(f"{stmt_indent}{converted}")
         collecting = False
@@ -251,10 +287,12 @@ def generate_va_method_from_test_method(
 
         # Collect multi-line Espresso statements
         if collecting:
-            buffer.append(line)
+            buffer.append(stripped)
             paren_balance += line.count("(") - line.count(")")
-            joined = " ".join(l.strip() for l in buffer)
-            if ".perform(" in joined and joined.rstrip().endswith(");") and paren_balance <= 0:
+            if stripped:
+                perform_seen = perform_seen or ".perform(" in stripped
+                ends_with_call = stripped.endswith(");")
+            if perform_seen and ends_with_call and paren_balance <= 0:
                 flush_buffer()
             continue
 
@@ -262,12 +300,13 @@ def generate_va_method_from_test_method(
             continue
 
         # Start collecting an Espresso statement
-        if any(entry in stripped for entry in ("onView(", "onData(", "onWebView(")):
-            buffer = [line]
+        if "onView(" in stripped or "onData(" in stripped or "onWebView(" in stripped:
+            buffer = [stripped]
             collecting = True
             paren_balance = line.count("(") - line.count(")")
-            joined = " ".join(l.strip() for l in buffer)
-            if ".perform(" in joined and joined.rstrip().endswith(");") and paren_balance <= 0:
+            perform_seen = ".perform(" in stripped
+            ends_with_call = stripped.endswith(");")
+            if perform_seen and ends_with_call and paren_balance <= 0:
                 flush_buffer()
             continue
 
@@ -288,7 +327,213 @@ def generate_va_method_from_test_method(
 # Workspace-level API
 # ---------------------------------------------------------------------------
 
-def process_app_workspace(app_id: str, workspace_root: str = "workspace") -> None:
+# ---------------------------------------------------------------------------
+# Input fingerprint (skip re-processing unchanged workspaces)
+# ---------------------------------------------------------------------------
+# After a successful run, {workspace_root}/.cache/workspace/<app_id>.stamp
+# records the fingerprint of input/ plus the converter version, and the name
+# and size of every file the run wrote to extracted_tests/ and va_methods/.
+# A later call with the same fingerprint whose recorded outputs are all still
+# in place (e.g. `extract` followed by `generate-va`) is a no-op.
+#
+# Bump the tag if the stamp format changes; converter edits are covered by
+# _converter_version().
+_WORKSPACE_STAMP_TAG = b"ava-workspace-2"
+
+# Stamp "outputs" entry: output dir name -> {file name -> size in bytes}.
+_StampOutputs = Dict[str, Dict[str, int]]
+
+
+def _input_fingerprint(input_dir: str) -> str:
+    """
+    Fingerprint input/ from one os.scandir pass over (name, size, mtime_ns),
+    together with the converter version.
+
+    Hashing every entry (instead of only the newest mtime) also catches
+    deleted or renamed input files.
+    """
+    entries = []
+    with os.scandir(input_dir) as it:
+        for entry in it:
+            if entry.is_file():
+                st = entry.stat()
+                entries.append(f"{entry.name}\0{st.st_size}\0{st.st_mtime_ns}")
+    entries.sort()
+    h = hashlib.blake2b(digest_size=16, person=_WORKSPACE_STAMP_TAG)
+    h.update(_converter_version().encode("ascii"))
+    h.update("\n".join(entries).encode("utf-8"))
+    return h.hexdigest()
+
+
+def _read_stamp(stamp_path: str) -> Optional[dict]:
+    """Load a stamp, or return None if it is missing or not a valid stamp."""
+    try:
+        with open(stamp_path, "rb") as f:
+            stamp = json.loads(f.read())
+    except (OSError, ValueError):
+        return None
+    return stamp if isinstance(stamp, dict) else None
+
+
+def _write_stamp(stamp_path: str, fingerprint: str, outputs: _StampOutputs) -> None:
+    try:
+        os.makedirs(os.path.dirname(stamp_path), exist_ok=True)
+        with open(stamp_path, "w", encoding="utf-8") as f:
+            json.dump({"fingerprint": fingerprint, "outputs": outputs}, f, ensure_ascii=False)
+    except OSError:
+        pass
+
+
+def _stamp_outputs_intact(stamp: dict, output_dirs: Dict[str, str]) -> bool:
+    """
+    Return True if every file recorded in the stamp still exists in its
+    output directory with the recorded size.
+    """
+    outputs = stamp.get("outputs")
+    if not isinstance(outputs, dict) or set(outputs) != set(output_dirs):
+        return False
+    for key, out_dir in output_dirs.items():
+        files = outputs[key]
+        if not isinstance(files, dict) or not os.path.isdir(out_dir):
+            return False
+        for name, size in files.items():
+            try:
+                if os.stat(os.path.join(out_dir, name)).st_size != size:
+                    return False
+            except OSError:
+                return False
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Conversion cache (skip re-converting unchanged test classes)
+# ---------------------------------------------------------------------------
+# Entries live in {workspace_root}/.cache/convert/<app_id>/<key>.json, where
+# key is a BLAKE2b digest of the converter version, the language and the
+# test class source. Each entry holds the (method_name, method_source,
+# va_java) triples for that class. Entries the latest run of an app did not
+# use are pruned at the end of that run.
+#
+# The converter version is a digest of the converter modules' source, so
+# editing any of them (or the SUPPORTED_* tables) invalidates the cache on
+# its own. Bump the tag only if the cache entry format itself changes.
+_CONVERT_CACHE_TAG = b"ava-convert-2"
+
+
+@lru_cache(maxsize=None)
+def _converter_version() -> str:
+    """
+    Digest of every module whose code shapes the extraction / conversion
+    output (this module, the statement converter, the SUPPORTED_* tables,
+    the extractors and the exceptions), computed once per process.
+    """
+    return module_source_digest(
+        (
+            sys.modules[__name__],
+            statement_converter,
+            supported_espresso_apis,
+            java_extractor,
+            kotlin_extractor,
+            converter_exceptions,
+        )
+    )
+
+
+def _convert_cache_key(source: str, language: str) -> str:
+    """Return the cache key (BLAKE2b hex digest) for a test class source."""
+    return hashlib.blake2b(
+        f"{_converter_version()}\0{language}\0{source}".encode("utf-8"),
+        digest_size=16,
+        person=_CONVERT_CACHE_TAG,
+    ).hexdigest()
+
+
+def _load_cached_conversion(cache_dir: str, key: str) -> Optional[List[Tuple[str, str, str]]]:
+    """Load a cached conversion, or return None on a miss or broken entry."""
+    path = os.path.join(cache_dir, f"{key}.json")
+    try:
+        with open(path, "rb") as f:
+            entries = json.loads(f.read())
+        return [(name, method_src, va_java) for name, method_src, va_java in entries]
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def _store_cached_conversion(
+    cache_dir: str, key: str, converted: List[Tuple[str, str, str]]
+) -> None:
+    """Write a conversion to the cache. Failures are ignored (best effort)."""
+    path = os.path.join(cache_dir, f"{key}.json")
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        write_bytes_atomic(path, json.dumps(converted, ensure_ascii=False).encode("utf-8"))
+    except OSError:
+        pass
+
+
+def _prune_conversion_cache(cache_dir: str, used_keys: set) -> None:
+    """Remove cache entries not in `used_keys`. Failures are ignored."""
+    try:
+        with os.scandir(cache_dir) as it:
+            stale = [
+                entry.path
+                for entry in it
+                if entry.name.endswith(".json") and entry.name[:-5] not in used_keys
+            ]
+    except OSError:
+        return
+    for path in stale:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+# Below this many test class files, process_app_workspace converts serially.
+_PARALLEL_MIN_TEST_FILES = 32
+
+
+def _convert_test_class(
+    source: str,
+    language: str,
+    cache_dir: Optional[str] = None,
+) -> List[Tuple[str, str, str]]:
+    """
+    Split one test class and convert each @Test method, returning
+    (method_name, method_source, va_java) tuples in source order.
+
+    Defined at module level so it can run in a ProcessPoolExecutor worker;
+    the caller reads the file and writes all outputs. When `cache_dir` is
+    given, the content-hash cache is consulted and updated.
+    """
+    if cache_dir is not None:
+        cache_key = _convert_cache_key(source, language)
+        cached = _load_cached_conversion(cache_dir, cache_key)
+        if cached is not None:
+            return cached
+
+    if language == "java":
+        test_methods = split_test_methods_from_java_source(source)
+    else:
+        test_methods = split_test_methods_from_kotlin_source(source)
+    converted = [
+        (method_name, method_src, generate_va_method_from_test_method(method_src, language=language))
+        for method_name, method_src in test_methods.items()
+    ]
+
+    if cache_dir is not None:
+        _store_cached_conversion(cache_dir, cache_key, converted)
+    return converted
+
+
+def process_app_workspace(
+    app_id: str,
+    workspace_root: str = "workspace",
+    *,
+    force: bool = False,
+    use_cache: Optional[bool] = None,
+    max_workers: Optional[int] = None,
+) -> None:
     """
     Process one app's AVA-Gen workspace.
 
@@ -312,6 +557,22 @@ def process_app_workspace(app_id: str, workspace_root: str = "workspace") -> Non
 
     Note:
       Skill description generation (JSON) is done separately in skill_interpreter.
+
+    If input/ and the converter are unchanged since the last successful run
+    (same file names, sizes and mtimes; same converter source) and every
+    file that run wrote to extracted_tests/ and va_methods/ is still there
+    with the same size, the call returns without re-processing. Pass
+    force=True to always re-process.
+
+    Otherwise, test classes whose source has not changed are served from
+    the content-hash cache under {workspace_root}/.cache/convert/<app_id>/
+    instead of being converted again; entries this run did not use are
+    removed. `use_cache` defaults to settings.convert_cache
+    (AVA_GEN_CONVERT_CACHE).
+
+    Apps with at least _PARALLEL_MIN_TEST_FILES test class files are
+    converted in a process pool of `max_workers` processes (default: one
+    per CPU); pass max_workers=1 to force serial conversion.
     """
 
     # ------------------------------
@@ -325,76 +586,139 @@ def process_app_workspace(app_id: str, workspace_root: str = "workspace") -> Non
     if not os.path.isdir(input_dir):
         raise FileNotFoundError(f"Input directory not found: {input_dir}")
 
+    stamp_path = os.path.join(workspace_root, ".cache", "workspace", f"{app_id}.stamp")
+    output_dirs = {"extracted_tests": extracted_dir, "va_methods": va_dir}
+    fingerprint = _input_fingerprint(input_dir)
+    stamp = None if force else _read_stamp(stamp_path)
+    if (
+        stamp is not None
+        and stamp.get("fingerprint") == fingerprint
+        and _stamp_outputs_intact(stamp, output_dirs)
+    ):
+        print(f"[AVA-Gen] Input unchanged for app_id='{app_id}', skipping re-processing")
+        return
+
     os.makedirs(extracted_dir, exist_ok=True)
     os.makedirs(va_dir, exist_ok=True)
 
+    if use_cache is None:
+        use_cache = settings.convert_cache
+    cache_dir = os.path.join(workspace_root, ".cache", "convert", app_id) if use_cache else None
+
     # ------------------------------
     # Iterate through input files
     # ------------------------------
-    for fname in os.listdir(input_dir):
-        fpath = os.path.join(input_dir, fname)
-        if not os.path.isfile(fpath):
-            continue
-
-        # Skip app introduction file
-        if fname == "app_introduction.txt":
-            print(f"[AVA-Gen] Found app introduction: {fpath}")
-            continue
-
-        # Accept only Java/Kotlin test classes
-        if not (fname.endswith(".java") or fname.endswith(".kt")):
-            print(f"[AVA-Gen] Skipping non-test file: {fname}")
-            continue
+    # scandir reports the file type from the directory listing itself, so
+    # no extra stat() per entry is needed (except for symlinks).
+    with os.scandir(input_dir) as it:
+        entries = [entry for entry in it if entry.is_file()]
 
-        # Determine language
-        language = detect_language_from_path(fpath)
+    test_files: List[Tuple[str, str]] = []  # (path, language)
+    for entry in entries:
+        if entry.name.endswith(".java") or entry.name.endswith(".kt"):
+            test_files.append((entry.path, detect_language_from_path(entry.path)))
 
+    def read_source(fpath: str) -> str:
         with open(fpath, "r", encoding="utf-8") as f:
-            source = f.read()
-
-        # Extract test methods
-        if language == "java":
-            test_methods = split_test_methods_from_java_source(source)
-            ext = ".java"
-        else:
-            test_methods = split_test_methods_from_kotlin_source(source)
-            ext = ".kt"
-
-        if not test_methods:
-            print(f"[AVA-Gen] WARNING: No @Test methods found in {fname}")
-            continue
+            return f.read()
+
+    sources = [read_source(fpath) for fpath, _ in test_files]
+
+    # Conversion is CPU-bound and independent per test class, so apps with
+    # many of them are spread over a process pool. Results are consumed in
+    # listing order either way, so messages and output files are the same.
+    if max_workers == 1 or len(test_files) < _PARALLEL_MIN_TEST_FILES:
+        converted = (
+            _convert_test_class(source, language, cache_dir)
+            for source, (_, language) in zip(sources, test_files)
+        )
+        executor = None
+    else:
+        # Lazy import: concurrent.futures.process is only needed here.
+        from concurrent.futures import ProcessPoolExecutor
+
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+        converted = executor.map(
+            _convert_test_class,
+            sources,
+            [language for _, language in test_files],
+            repeat(cache_dir),
+        )
+
+    # (output dir key, file name, path) of every file written, for the stamp.
+    written_files: List[Tuple[str, str, str]] = []
+    try:
+        for entry in entries:
+            fname = entry.name
+            fpath = entry.path
+
+            # Skip app introduction file
+            if fname == "app_introduction.txt":
+                print(f"[AVA-Gen] Found app introduction: {fpath}")
+                continue
 
-        # ------------------------------
-        # Process each extracted test method
-        # ------------------------------
-        for raw_method_name, method_src in test_methods.items():
+            # Accept only Java/Kotlin test classes
+            if not (fname.endswith(".java") or fname.endswith(".kt")):
+                print(f"[AVA-Gen] Skipping non-test file: {fname}")
+                continue
 
-            # Normalize method name (remove spaces, line breaks)
-            method_name = raw_method_name.strip()
+            ext = ".java" if fname.endswith(".java") else ".kt"
+            test_methods = next(converted)
 
-            # ------------------------------
-            # 1) Save the stripped test method
-            # ------------------------------
-            extracted_path = os.path.join(extracted_dir, f"{method_name}{ext}")
-            with open(extracted_path, "w", encoding="utf-8") as out_f:
-                out_f.write(method_src)
-                out_f.write("\n")
+            if not test_methods:
+                print(f"[AVA-Gen] WARNING: No @Test methods found in {fname}")
+                continue
 
             # ------------------------------
-            # 2) Convert to a VA Java method
+            # Process each extracted test method
             # ------------------------------
-            va_java = generate_va_method_from_test_method(method_src, language=language)
-
-            # Remove trailing "Test" suffix if present
-            if method_name.endswith("Test"):
-                va_method_name = method_name[:-4]
-            else:
-                va_method_name = method_name
-
-            va_path = os.path.join(va_dir, f"{va_method_name}.java")
-            with open(va_path, "w", encoding="utf-8") as out_f:
-                out_f.write(va_java)
-                out_f.write("\n")
+            for raw_method_name, method_src, va_java in test_methods:
+
+                # Normalize method name (remove spaces, line breaks)
+                method_name = raw_method_name.strip()
+
+                # ------------------------------
+                # 1) Save the stripped test method
+                # ------------------------------
+                extracted_name = f"{method_name}{ext}"
+                extracted_path = os.path.join(extracted_dir, extracted_name)
+                with open(extracted_path, "w", encoding="utf-8") as out_f:
+                    out_f.write(method_src)
+                    out_f.write("\n")
+                written_files.append(("extracted_tests", extracted_name, extracted_path))
+
+                # ------------------------------
+                # 2) Save the converted VA Java method
+                # ------------------------------
+                # Remove trailing "Test" suffix if present
+                if method_name.endswith("Test"):
+                    va_method_name = method_name[:-4]
+                else:
+                    va_method_name = method_name
+
+                va_name = f"{va_method_name}.java"
+                va_path = os.path.join(va_dir, va_name)
+                with open(va_path, "w", encoding="utf-8") as out_f:
+                    out_f.write(va_java)
+                    out_f.write("\n")
+                written_files.append(("va_methods", va_name, va_path))
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    if cache_dir is not None:
+        _prune_conversion_cache(
+            cache_dir,
+            {
+                _convert_cache_key(source, language)
+                for source, (_, language) in zip(sources, test_files)
+            },
+        )
+
+    outputs: _StampOutputs = {key: {} for key in output_dirs}
+    for key, name, path in written_files:
+        outputs[key][name] = os.path.getsize(path)
+    _write_stamp(stamp_path, fingerprint, outputs)
 
     # ------------------------------
     # Done!
@@ -5,7 +5,8 @@ Intent → method mapping based on skills_description files.
 
 Assumptions about workspace layout
 ----------------------------------
-- All skills description files live under `workspace/`, typically in `workspace/skills_description/`, with names:
+- Skills description files live in `workspace/skills_description/` (or
+  directly in `workspace/`), with names:
 
     {app_id}_skills_description.json
 
@@ -45,9 +46,17 @@ In case (2), we only have intent strings (no method_name mapping).
 """
 
 import json
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
+
+from pydantic import TypeAdapter
+
+# Serializes the exported intent files with pydantic-core's native JSON
+# encoder. The bytes are identical to json.dumps(..., indent=2,
+# ensure_ascii=False), only produced without Python-level encoding work.
+_INTENT_FILE_ADAPTER = TypeAdapter(Any)
 
 
 @dataclass
@@ -64,6 +73,14 @@ class AppIntentIndex:
 
     app_id: str
     intents: List[IntentEntry]
+    # intent -> method_name, built once from `intents` (the first entry wins
+    # for a repeated intent) so lookups don't scan the list.
+    intent_to_method: Dict[str, Optional[str]] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.intent_to_method = {}
+        for entry in self.intents:
+            self.intent_to_method.setdefault(entry.intent, entry.method_name)
 
     @property
     def intent_list(self) -> List[str]:
@@ -116,11 +133,7 @@ class IntentInterpreter:
         index = self._apps.get(app_id)
         if not index:
             return None
-
-        for entry in index.intents:
-            if entry.intent == intent:
-                return entry.method_name
-        return None
+        return index.intent_to_method.get(intent)
 
     def list_apps(self) -> List[str]:
         """Return all app_ids discovered in the workspace."""
@@ -229,8 +242,7 @@ class IntentInterpreter:
 
             data.append(item)
 
-        with output.open("w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        output.write_bytes(_INTENT_FILE_ADAPTER.dump_json(data, indent=2))
 
         return output
 
@@ -291,8 +303,7 @@ class IntentInterpreter:
             if app_map:
                 mapping[app_id] = app_map
 
-        with output.open("w", encoding="utf-8") as f:
-            json.dump(mapping, f, indent=2, ensure_ascii=False)
+        output.write_bytes(_INTENT_FILE_ADAPTER.dump_json(mapping, indent=2))
 
         return output
 
@@ -302,19 +313,30 @@ class IntentInterpreter:
 
     def _load_all_skills_descriptions(self) -> None:
         """
-        Scan the workspace for *skills_description.json files and build indexes.
+        Scan the workspace for *_skills_description.json files and build indexes.
 
         Expected pattern:
+            workspace/skills_description/{app_id}_skills_description.json
             workspace/{app_id}_skills_description.json
+
+        Only these two directories are listed (workspace/ first, so a file in
+        skills_description/ wins for the same app_id). Walking the whole tree
+        would also stat every file under the generated per-app directories.
         """
-        pattern = "*_skills_description.json"
-        for path in self.workspace_root.rglob(pattern):
+        suffix = "_skills_description.json"
+        for root in (self.workspace_root, self.workspace_root / "skills_description"):
             try:
-                index = self._load_single_file(path)
-            except Exception:
-                # For robustness: skip broken files rather than crash.
+                with os.scandir(root) as it:
+                    paths = [Path(e.path) for e in it if e.name.endswith(suffix) and e.is_file()]
+            except OSError:
                 continue
-            self._apps[index.app_id] = index
+            for path in paths:
+                try:
+                    index = self._load_single_file(path)
+                except Exception:
+                    # For robustness: skip broken files rather than crash.
+                    continue
+                self._apps[index.app_id] = index
 
     def _load_single_file(self, path: Path) -> AppIntentIndex:
         """Load one {app_id}_skills_description.json and build AppIntentIndex."""
@@ -336,21 +358,21 @@ class IntentInterpreter:
             skills = data.get("skills") or data.get("methods") or []
             intents: List[IntentEntry] = []
             for skill in skills:
-                method_name = skill.get("method_name")
-                short = skill.get("description_short") or ""
-                detail = skill.get("description_detail") or ""
+                get = skill.get
+                short = (get("description_short") or "").strip()
+                detail = (get("description_detail") or "").strip()
                 # Combine short + detail; you can tweak how they are concatenated.
-                pieces = [short.strip(), detail.strip()]
-                combined = " ".join(p for p in pieces if p)
+                # Both are stripped, so strip() only drops an unused separator.
+                combined = f"{short} {detail}".strip()
                 if combined:
-                    intents.append(IntentEntry(intent=combined, method_name=method_name))
+                    intents.append(IntentEntry(intent=combined, method_name=get("method_name")))
             return AppIntentIndex(app_id=app_id, intents=intents)
 
         # Case 2: already aggregated intentList without method mappings
         if "intentList" in data:
             intents = [
                 IntentEntry(intent=str(text), method_name=None)
-                for text in data.get("intentList", [])
+                for text in data["intentList"]
             ]
             return AppIntentIndex(app_id=app_id, intents=intents)
 
@@ -358,9 +380,10 @@ class IntentInterpreter:
         # In this format the method name is the dict key and we treat
         # description-short and description-detail as separate intents that both
         # map to the same method.
-        if "context_methods" in data and isinstance(data["context_methods"], dict):
+        context_methods = data.get("context_methods")
+        if isinstance(context_methods, dict):
             intents: List[IntentEntry] = []
-            for method_name, value in data["context_methods"].items():
+            for method_name, value in context_methods.items():
                 if not isinstance(value, dict):
                     continue
                 short = (value.get("description-short") or "").strip()
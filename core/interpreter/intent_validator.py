@@ -28,24 +28,36 @@ rather than parsing individual *_skills_description.json files directly.
 
 from __future__ import annotations
 
+import asyncio
 import json
-from dataclasses import dataclass
+import logging
+import os
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Protocol
+from typing import Any, Dict, FrozenSet, List, Optional, Protocol, Sequence, Tuple, Union
 
 from pydantic import BaseModel
 from core.api import openai_client
 from configs.settings import settings  # ✅ use your existing Settings instance
 
 
+logger = logging.getLogger(__name__)
+
+
 # ---------------------------------------------------------------------------
 # Result + backend interface
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class IntentValidationResult:
-    """Structured result of an intent validation / matching call."""
+    """
+    Structured result of an intent validation / matching call.
+
+    Instances are immutable; the OpenAI backend hands the same memoized
+    result to every request that hits its cache.
+    """
 
     is_supported: bool
     matched_intent: Optional[str] = None
@@ -64,13 +76,17 @@ class IntentMatcherBackend(Protocol):
 
     The backend is intentionally decoupled from the workspace layout and
     from any HTTP/DB details.
+
+    A backend may also provide a coroutine amatch_intent with the same
+    signature; IntentValidator.avalidate awaits it instead of running
+    match_intent in a worker thread.
     """
 
     def match_intent(
         self,
         app_id: str,
         message: str,
-        intents: List[str],
+        intents: Sequence[str],
         history: Optional[List[Any]] = None,
     ) -> IntentValidationResult:
         """
@@ -87,6 +103,53 @@ class IntentMatcherBackend(Protocol):
         ...
 
 
+# ---------------------------------------------------------------------------
+# Parsed intent file cache
+# ---------------------------------------------------------------------------
+
+# The parsed form of a workspace's intent files is a pure function of those
+# files, so it is kept per intent directory and shared (read-only) by every
+# IntentValidator built over the same workspace. Each entry is stored with the
+# (st_mtime_ns, st_size) signature of both files; a regenerated or edited file
+# changes the signature and the next instance parses it again.
+#
+# intent dir -> (signature, (apps, method_by_app_intent, intent_list_loaded,
+#                             intent_map_loaded))
+_APPS_CACHE: Dict[str, Tuple[Tuple[Any, ...], Tuple[Any, ...]]] = {}
+
+
+@dataclass(slots=True)
+class _AppInfo:
+    """Parsed intent data for one app_id (built by IntentValidator._load_all)."""
+
+    intents: Tuple[str, ...] = ()
+    # The same intents, for O(1) membership tests.
+    intents_set: FrozenSet[str] = frozenset()
+    # Normalized intent text -> intent, for the exact-match fast path.
+    intent_by_norm: Dict[str, str] = field(default_factory=dict)
+    intent_to_method: Dict[str, str] = field(default_factory=dict)
+    # As found in intent_list_full.json; get_intent_summary_for_app cleans it.
+    intent_summary: Any = None
+
+
+# Stand-in for an unknown app_id, so lookups need no per-call fallback.
+_EMPTY_APP_INFO = _AppInfo()
+
+
+def _normalize_for_exact_match(text: str) -> str:
+    """Normalize an intent or message for the exact-match fast path."""
+    return text.strip().lower()
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    """Return (st_mtime_ns, st_size) for path, or None if it cannot be stat'ed."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
 # ---------------------------------------------------------------------------
 # IntentValidator
 # ---------------------------------------------------------------------------
@@ -102,6 +165,7 @@ class IntentValidator:
     This is the object that ConversationAgent expects to work with:
 
         result = intent_validator.validate(app_id, message, history)
+        # or, on an event loop: await intent_validator.avalidate(...)
         result.is_supported, result.matched_intent, result.method_name, result.reason
 
         method_name = intent_validator.get_method_for_intent(app_id, intent)
@@ -117,36 +181,45 @@ class IntentValidator:
         self.workspace_root = Path(workspace_root)
         self.backend = backend
 
-        # app_id -> {
-        #   "intents": List[str],
-        #   "intent_to_method": Dict[str, str],
-        # }
-        self._apps: Dict[str, Dict[str, Any]] = {}
+        self._apps: Dict[str, _AppInfo] = {}
+        # (app_id, intent text) -> method_name, flattened from the per-app
+        # intent_to_method dicts so a lookup is a single hash.
+        self._method_by_app_intent: Dict[Tuple[str, str], str] = {}
         self._intent_list_loaded: bool = False
         self._intent_map_loaded: bool = False
 
-        self._load_intent_list()
-        self._load_intent_method_map()
+        # The intent files are read on first use (see _ensure_loaded), so
+        # constructing a validator that is never asked anything costs no I/O.
+        self._loaded: bool = False
 
     # ------------------------------------------------------------------
     # Public API used by ConversationAgent
     # ------------------------------------------------------------------
 
-    def get_intents_for_app(self, app_id: str) -> List[str]:
-        """Return the list of allowed intent strings for a given app_id."""
-        info = self._apps.get(app_id) or {}
-        return list(info.get("intents", []))
+    def get_intents_for_app(self, app_id: str) -> Sequence[str]:
+        """
+        Return the allowed intent strings for a given app_id.
+
+        The tuple is shared with the validator's cache rather than copied per
+        call; it is immutable, so callers cannot change it by accident.
+        """
+        self._ensure_loaded()
+        return self._apps.get(app_id, _EMPTY_APP_INFO).intents
+
+    def is_valid_intent(self, app_id: str, text: str) -> bool:
+        """Return True if text is exactly one of the allowed intents for app_id."""
+        self._ensure_loaded()
+        return text in self._apps.get(app_id, _EMPTY_APP_INFO).intents_set
 
     def get_method_for_intent(self, app_id: str, intent: str) -> Optional[str]:
         """Return the method_name corresponding to the given intent, if known."""
-        info = self._apps.get(app_id) or {}
-        mapping: Dict[str, str] = info.get("intent_to_method") or {}
-        return mapping.get(intent)
+        self._ensure_loaded()
+        return self._method_by_app_intent.get((app_id, intent))
 
     def get_intent_summary_for_app(self, app_id: str) -> Optional[str]:
         """Return the optional, precomputed intent_summary for an app, if available."""
-        info = self._apps.get(app_id) or {}
-        summary = info.get("intent_summary")
+        self._ensure_loaded()
+        summary = self._apps.get(app_id, _EMPTY_APP_INFO).intent_summary
         if isinstance(summary, str):
             summary = summary.strip()
         return summary or None
@@ -163,12 +236,70 @@ class IntentValidator:
         - Looks up the allowed intents for the app_id.
         - If none exist, returns is_supported=False with a reason.
         - If no backend is configured, returns is_supported=False with a reason.
+        - If the message is one of the intents (ignoring case and surrounding
+          whitespace), returns that intent without asking the backend.
         - Otherwise delegates to backend.match_intent(...).
 
         The backend MUST NOT expand the scope beyond the provided intents;
         it should only choose among them or reject.
         """
         intents = self.get_intents_for_app(app_id)
+        early = self._resolve_without_backend(app_id, message, intents)
+        if early is not None:
+            return early
+
+        # Delegate actual matching to the backend.
+        return self.backend.match_intent(
+            app_id=app_id,
+            message=message,
+            intents=intents,
+            history=history,
+        )
+
+    async def avalidate(
+        self,
+        app_id: str,
+        message: str,
+        history: Optional[List[Any]] = None,
+    ) -> IntentValidationResult:
+        """
+        Async variant of validate() for callers running on an event loop.
+
+        Uses the backend's amatch_intent coroutine when it has one;
+        otherwise the blocking match_intent runs in a worker thread so the
+        loop keeps serving other requests.
+        """
+        intents = self.get_intents_for_app(app_id)
+        early = self._resolve_without_backend(app_id, message, intents)
+        if early is not None:
+            return early
+
+        amatch_intent = getattr(self.backend, "amatch_intent", None)
+        if amatch_intent is not None:
+            return await amatch_intent(
+                app_id=app_id,
+                message=message,
+                intents=intents,
+                history=history,
+            )
+        return await asyncio.to_thread(
+            self.backend.match_intent,
+            app_id=app_id,
+            message=message,
+            intents=intents,
+            history=history,
+        )
+
+    def _resolve_without_backend(
+        self,
+        app_id: str,
+        message: str,
+        intents: Sequence[str],
+    ) -> Optional[IntentValidationResult]:
+        """
+        Return the result of validate() when it is decided before the
+        backend is asked (no intents, no backend, exact match), else None.
+        """
         if not intents:
             base_reason = f"No intents defined for app_id={app_id}."
             if not getattr(self, "_intent_list_loaded", False):
@@ -188,23 +319,66 @@ class IntentValidator:
                 reason="Intent backend is not configured.",
             )
 
-        # Delegate actual matching to the backend.
-        return self.backend.match_intent(
-            app_id=app_id,
-            message=message,
-            intents=intents,
-            history=history,
-        )
+        # Fast path: an exact (case-insensitive) intent needs no classifier.
+        info = self._apps.get(app_id, _EMPTY_APP_INFO)
+        exact = info.intent_by_norm.get(_normalize_for_exact_match(message))
+        if exact is not None:
+            return IntentValidationResult(
+                is_supported=True,
+                matched_intent=exact,
+                method_name=self.get_method_for_intent(app_id, exact),
+                reason="Exact match with an allowed intent.",
+            )
+        return None
 
     # ------------------------------------------------------------------
     # Internal loading helpers
     # ------------------------------------------------------------------
 
-    def _load_intent_list(self) -> None:
+    def _ensure_loaded(self) -> None:
+        """Load the intent files unless this instance has done so already."""
+        if not self._loaded:
+            self._load_intents()
+            self._loaded = True
+
+    def _load_intents(self) -> None:
+        """
+        Load both intent files, reusing the parsed result of an earlier
+        instance when neither file has changed since (see _APPS_CACHE).
         """
-        Load the aggregated intent list from workspace/intent/intent_list_full.json.
+        intent_dir = self.workspace_root / "intent"
+        signature = (
+            _file_signature(intent_dir / "intent_list_full.json"),
+            _file_signature(intent_dir / "intent_method_map.json"),
+        )
+        cache_key = os.path.abspath(intent_dir)
+        cached = _APPS_CACHE.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            (
+                self._apps,
+                self._method_by_app_intent,
+                self._intent_list_loaded,
+                self._intent_map_loaded,
+            ) = cached[1]
+            return
 
-        Expected format:
+        self._load_all(intent_dir)
+        _APPS_CACHE[cache_key] = (
+            signature,
+            (
+                self._apps,
+                self._method_by_app_intent,
+                self._intent_list_loaded,
+                self._intent_map_loaded,
+            ),
+        )
+
+    def _load_all(self, intent_dir: Path) -> None:
+        """
+        Load both intent files from workspace/intent/ and build self._apps in
+        one pass.
+
+        intent_list_full.json provides the allowed intents per app:
 
             [
               {
@@ -212,56 +386,13 @@ class IntentValidator:
                 "intents": [
                   "Open sleep statistics view",
                   "Opens the app's statistics screen..."
-                ]
+                ],
+                "intent_summary": "..."   # optional
               },
               ...
             ]
-        """
-        intent_path = self.workspace_root / "intent" / "intent_list_full.json"
-        if not intent_path.exists():
-            self._intent_list_loaded = False
-            return
-        try:
-            with intent_path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
-            # Do not wipe out _apps completely; we may also load a method map
-            # into the same structure. Start fresh but allow _load_intent_method_map
-            # to update per-app mapping later.
-            self._apps = {}
-            self._intent_list_loaded = True
-
-            for item in data:
-                if not isinstance(item, dict):
-                    continue
-                app_id = item.get("app_id")
-                if not app_id:
-                    continue
-
-                intents_data = item.get("intents") or []
-                intent_summary = item.get("intent_summary")
-                normalized_intents: List[str] = []
-
-                for entry in intents_data:
-                    text = str(entry).strip()
-                    if not text:
-                        continue
-                    normalized_intents.append(text)
-
-                self._apps[app_id] = {
-                    "intents": normalized_intents,
-                    # mapping will be filled by _load_intent_method_map()
-                    "intent_to_method": {},
-                    "intent_summary": intent_summary,
-                }
-        except Exception:
-            self._intent_list_loaded = False
-            self._apps = {}
-
-    def _load_intent_method_map(self) -> None:
-        """
-        Load the intent → method mapping from workspace/intent/intent_method_map.json.
 
-        Expected format:
+        intent_method_map.json provides the intent → method mapping:
 
             {
               "app_id": {
@@ -271,44 +402,94 @@ class IntentValidator:
               ...
             }
 
-        This augments self._apps[app_id]["intent_to_method"].
-        """
-        map_path = self.workspace_root / "intent" / "intent_method_map.json"
-        if not map_path.exists():
-            self._intent_map_loaded = False
-            return
-
-        try:
-            with map_path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            if not isinstance(data, dict):
-                self._intent_map_loaded = False
-                return
+        Each app's intent_to_method dict is built directly from the map,
+        instead of creating empty per-app entries first and filling them in
+        a second load; the same pass fills self._method_by_app_intent. Apps
+        that only appear in the map get an entry with no intents.
 
-            for app_id, mapping in data.items():
-                if not isinstance(mapping, dict):
-                    continue
+        Either file may be missing or invalid on its own; that only clears
+        the corresponding _intent_*_loaded flag. Unreadable or malformed
+        files are logged as warnings, and malformed entries inside a valid
+        file are skipped.
+        """
+        apps: Dict[str, _AppInfo] = {}
+        method_by_app_intent: Dict[Tuple[str, str], str] = {}
+
+        list_path = intent_dir / "intent_list_full.json"
+        self._intent_list_loaded = False
+        if list_path.exists():
+            try:
+                data = json.loads(list_path.read_bytes().decode("utf-8"))
+            except (OSError, ValueError) as exc:
+                # ValueError covers JSONDecodeError and UnicodeDecodeError.
+                logger.warning("Could not load %s: %s", list_path, exc)
+                data = None
+
+            if data is not None and not isinstance(data, list):
+                logger.warning("Ignoring %s: expected a JSON array of apps.", list_path)
+            elif data is not None:
+                self._intent_list_loaded = True
+
+                for item in data:
+                    if not isinstance(item, dict):
+                        continue
+                    app_id = item.get("app_id")
+                    if not app_id or not isinstance(app_id, str):
+                        continue
 
-                info = self._apps.get(app_id)
-                if info is None:
-                    info = {"intents": [], "intent_to_method": {}}
-                    self._apps[app_id] = info
+                    intents_data = item.get("intents")
+                    if not isinstance(intents_data, list):
+                        intents_data = []
+                    normalized_intents = tuple(
+                        text
+                        for text in (str(entry).strip() for entry in intents_data)
+                        if text
+                    )
+
+                    intent_by_norm: Dict[str, str] = {}
+                    for text in normalized_intents:
+                        intent_by_norm.setdefault(_normalize_for_exact_match(text), text)
+
+                    apps[app_id] = _AppInfo(
+                        intents=normalized_intents,
+                        intents_set=frozenset(normalized_intents),
+                        intent_by_norm=intent_by_norm,
+                        intent_summary=item.get("intent_summary"),
+                    )
+
+        map_path = intent_dir / "intent_method_map.json"
+        self._intent_map_loaded = False
+        if map_path.exists():
+            try:
+                data = json.loads(map_path.read_bytes().decode("utf-8"))
+            except (OSError, ValueError) as exc:
+                logger.warning("Could not load %s: %s", map_path, exc)
+                data = None
+
+            if data is not None and not isinstance(data, dict):
+                logger.warning("Ignoring %s: expected a JSON object keyed by app_id.", map_path)
+            elif data is not None:
+                for app_id, mapping in data.items():
+                    if not isinstance(mapping, dict):
+                        continue
 
-                intent_to_method: Dict[str, str] = info.get("intent_to_method") or {}
+                    info = apps.get(app_id)
+                    if info is None:
+                        info = _AppInfo()
+                        apps[app_id] = info
 
-                for intent_text, method_name in mapping.items():
-                    text = str(intent_text).strip()
-                    method = str(method_name).strip()
-                    if not text or not method:
-                        continue
-                    intent_to_method[text] = method
+                    intent_to_method = info.intent_to_method
+                    for intent_text, method_name in mapping.items():
+                        text = str(intent_text).strip()
+                        method = str(method_name).strip()
+                        if text and method:
+                            intent_to_method[text] = method
+                            method_by_app_intent[(app_id, text)] = method
 
-                info["intent_to_method"] = intent_to_method
+                self._intent_map_loaded = True
 
-            self._intent_map_loaded = True
-        except Exception:
-            self._intent_map_loaded = False
+        self._apps = apps
+        self._method_by_app_intent = method_by_app_intent
 
 
 # ---------------------------------------------------------------------------
@@ -330,6 +511,59 @@ class IntentMatchResultModel(BaseModel):
     reason: Optional[str] = None
 
 
+# Fixed parts of the intent-matching prompt built by match_intent(). The
+# prompt constrains GPT to only choose among the provided intents and allows
+# it to say "unsupported" when nothing fits.
+_INTENT_PROMPT_HEAD = (
+    "You are an intent classifier for a single mobile app. "
+    "Your job is to decide whether the user's request matches one of the "
+    "allowed intents for this app.\n"
+    "\n"
+    "App id: "
+)
+
+_INTENT_PROMPT_TAIL = (
+    "\n"
+    "\n"
+    "Decide the following and respond ONLY with a single valid JSON object.\n"
+    "- is_supported: true or false.\n"
+    "- matched_intent: if is_supported is true, the SINGLE best intent string, "
+    "exactly as it appears in the allowed intents list; otherwise null.\n"
+    "- reason: a short natural-language explanation of your decision (at most 20 words).\n"
+    "\n"
+    "The JSON must:\n"
+    "- use double quotes for all keys and string values (standard JSON).\n"
+    "- NOT include any markdown, code fences, or backticks.\n"
+    "- NOT include any extra commentary before or after the JSON.\n"
+    "- NOT escape single quotes inside strings; write \"user's data\" not \"user\\'s data\".\n"
+    "The JSON must have exactly these keys: "
+    '"is_supported", "matched_intent", "reason".'
+)
+
+
+def _history_lines(history: Optional[List[Any]], last: int = 4) -> List[str]:
+    """
+    Format the last few turns of a conversation as "role: message" lines.
+
+    Turns are duck-typed (runtime Turn models, or anything with the same
+    attributes); a missing role reads as "user" and turns without a message
+    are skipped. getattr with a default cannot raise for such objects, so no
+    per-turn exception handling is needed.
+    """
+    if not history:
+        return []
+    lines: List[str] = []
+    for turn in history[-last:]:
+        text = getattr(turn, "message", "")
+        if text:
+            lines.append(f"{getattr(turn, 'role', 'user')}: {text}")
+    return lines
+
+
+# Upper bound on memoized match_intent results kept per backend instance.
+_MATCH_CACHE_SIZE = 1024
+
+
 class OpenAIIntentMatcherBackend(IntentMatcherBackend):
     """IntentMatcherBackend implementation using the project-local openai_client.
 
@@ -337,22 +571,64 @@ class OpenAIIntentMatcherBackend(IntentMatcherBackend):
     prompt and parse a structured response. It does *not* know anything
     about FastAPI, sessions, or storage.
 
-    It relies on openai_client.send_request_to_gpt, which already manages
-    model configuration and basic error handling. Here we only define:
+    It relies on openai_client.send_request_to_gpt (async_send_request_to_gpt
+    in amatch_intent), which already manages model configuration and basic
+    error handling. Here we only define:
     - the prompt format
     - the structured output schema (IntentMatchResultModel)
+
+    Successful results are memoized (LRU, _MATCH_CACHE_SIZE entries) on
+    everything the prompt is built from: app_id, the allowed intents, the
+    history lines and the message. At temperature 0 the same prompt gives the
+    same answer, so a retried or replayed request skips the GPT round trip.
+    Backend errors are never cached.
     """
 
     def __init__(self, model: Optional[str] = None, temperature: float = 0.0) -> None:
         # Prefer explicitly provided model; otherwise load from global settings
         self.model = settings.intent_model
         self.temperature = temperature  # currently encoded in the prompt text
+        self._match_cache: "OrderedDict[Tuple[Any, ...], IntentValidationResult]" = OrderedDict()
+        # app_id -> (intents, numbered "1. ...\n2. ..." block, frozenset of
+        # the intents), all derived from the same intents tuple
+        self._intents_block_cache: Dict[
+            str, Tuple[Tuple[str, ...], str, FrozenSet[str]]
+        ] = {}
+
+    def clear_cache(self) -> None:
+        """Drop all memoized match_intent results and prompt blocks."""
+        self._match_cache.clear()
+        self._intents_block_cache.clear()
+
+    def _intents_block(
+        self, app_id: str, intents: Sequence[str]
+    ) -> Tuple[str, FrozenSet[str]]:
+        """
+        Return the numbered intent list for the prompt and the set of allowed
+        intents, reusing what was built for app_id as long as it is asked
+        for with the same intents.
+
+        IntentValidator hands out the same tuple for an app on every call, so
+        the check is normally an identity test; a changed intent list (e.g.
+        after the intent files were regenerated) rebuilds the block. Lists
+        are snapshotted as tuples so later in-place edits cannot go unseen.
+        """
+        intents = tuple(intents)
+        cached = self._intents_block_cache.get(app_id)
+        if cached is not None and (cached[0] is intents or cached[0] == intents):
+            return cached[1], cached[2]
+        block = "\n".join(
+            f"{idx}. {intent}" for idx, intent in enumerate(intents, start=1)
+        )
+        allowed = frozenset(intents)
+        self._intents_block_cache[app_id] = (intents, block, allowed)
+        return block, allowed
 
     def match_intent(
         self,
         app_id: str,
         message: str,
-        intents: List[str],
+        intents: Sequence[str],
         history: Optional[List[Any]] = None,
     ) -> IntentValidationResult:
         """Call GPT via openai_client to choose the best intent or reject.
@@ -366,87 +642,125 @@ class OpenAIIntentMatcherBackend(IntentMatcherBackend):
            - current user message
         3. Ask GPT to output a JSON object matching IntentMatchResultModel.
         """
-        if not intents:
+        prepared = self._prepare_match(app_id, message, intents, history)
+        if isinstance(prepared, IntentValidationResult):
+            return prepared
+        cache_key, full_prompt, allowed_intents = prepared
+
+        try:
+            result_model = openai_client.send_request_to_gpt(
+                full_prompt,
+                structured_output=IntentMatchResultModel,
+                model=self.model,
+            )
+        except Exception as exc:
+            # Any unexpected error from the helper/OpenAI -> treat as unsupported
+            # but do NOT crash the whole runtime.
             return IntentValidationResult(
                 is_supported=False,
-                reason="No intents provided to the OpenAI backend.",
+                reason=f"OpenAI backend error: {exc}",
             )
+        return self._finish_match(cache_key, allowed_intents, result_model)
 
-        # Prepare a short text history snippet (last few turns).
-        history_lines: List[str] = []
-        if history:
-            for turn in history[-4:]:
-                try:
-                    role = getattr(turn, "role", "user")
-                    text = getattr(turn, "message", "")
-                    if not text:
-                        continue
-                    history_lines.append(f"{role}: {text}")
-                except Exception:
-                    continue
-
-        history_block = "\n".join(history_lines) if history_lines else "None"
-
-        # Build the prompt. We:
-        # - constrain GPT to only choose among the provided intents
-        # - allow it to say "unsupported" when nothing fits
-        prompt_lines: List[str] = []
-        prompt_lines.append(
-            "You are an intent classifier for a single mobile app. "
-            "Your job is to decide whether the user's request matches one of the "
-            "allowed intents for this app."
-        )
-        prompt_lines.append("")
-        prompt_lines.append(f"App id: {app_id}")
-        prompt_lines.append("")
-        prompt_lines.append("Allowed intents (each line is one intent string):")
-        for idx, intent in enumerate(intents, start=1):
-            prompt_lines.append(f"{idx}. {intent}")
-        prompt_lines.append("")
-        prompt_lines.append("Recent conversation history (oldest to newest):")
-        prompt_lines.append(history_block)
-        prompt_lines.append("")
-        prompt_lines.append("Current user request:")
-        prompt_lines.append(message)
-        prompt_lines.append("")
-        prompt_lines.append(
-            "Decide the following and respond ONLY with a single valid JSON object.\n"
-            "- is_supported: true or false.\n"
-            "- matched_intent: if is_supported is true, the SINGLE best intent string, "
-            "exactly as it appears in the allowed intents list; otherwise null.\n"
-            "- reason: a short natural-language explanation of your decision (at most 20 words)."
-        )
-        prompt_lines.append("")
-        prompt_lines.append(
-            "The JSON must:\n"
-            "- use double quotes for all keys and string values (standard JSON).\n"
-            "- NOT include any markdown, code fences, or backticks.\n"
-            "- NOT include any extra commentary before or after the JSON.\n"
-            "- NOT escape single quotes inside strings; write \"user's data\" not \"user\\'s data\".\n"
-            "The JSON must have exactly these keys: "
-            '"is_supported", "matched_intent", "reason".'
-        )
-
-        full_prompt = "\n".join(prompt_lines)
+    async def amatch_intent(
+        self,
+        app_id: str,
+        message: str,
+        intents: Sequence[str],
+        history: Optional[List[Any]] = None,
+    ) -> IntentValidationResult:
+        """Async variant of match_intent, using the shared AsyncOpenAI client."""
+        prepared = self._prepare_match(app_id, message, intents, history)
+        if isinstance(prepared, IntentValidationResult):
+            return prepared
+        cache_key, full_prompt, allowed_intents = prepared
 
         try:
-            result_model = openai_client.send_request_to_gpt(
+            result_model = await openai_client.async_send_request_to_gpt(
                 full_prompt,
                 structured_output=IntentMatchResultModel,
                 model=self.model,
             )
         except Exception as exc:
-            # Any unexpected error from the helper/OpenAI -> treat as unsupported
-            # but do NOT crash the whole runtime.
             return IntentValidationResult(
                 is_supported=False,
                 reason=f"OpenAI backend error: {exc}",
             )
+        return self._finish_match(cache_key, allowed_intents, result_model)
 
-        # Convert the Pydantic model into our dataclass.
-        return IntentValidationResult(
-            is_supported=result_model.is_supported,
-            matched_intent=result_model.matched_intent,
-            method_name=None,  # always resolved by server-side map, never by GPT
-            reason=result_model.reason,
+    def _prepare_match(
+        self,
+        app_id: str,
+        message: str,
+        intents: Sequence[str],
+        history: Optional[List[Any]],
+    ) -> Union[IntentValidationResult, Tuple[Tuple[Any, ...], str, FrozenSet[str]]]:
+        """
+        Return a final result if GPT need not be asked (no intents, or a
+        memoized answer), else (cache_key, prompt, allowed intents).
+        """
+        if not intents:
+            return IntentValidationResult(
+                is_supported=False,
+                reason="No intents provided to the OpenAI backend.",
+            )
+
+        # Prepare a short text history snippet (last few turns).
+        history_lines = _history_lines(history)
+
+        cache_key = (app_id, message, tuple(history_lines), tuple(intents))
+        cached = self._match_cache.get(cache_key)
+        if cached is not None:
+            self._match_cache.move_to_end(cache_key)
+            return cached
+
+        history_block = "\n".join(history_lines) if history_lines else "None"
+
+        # Build the prompt. Only the app id, the numbered intents, the history
+        # and the message vary; the rest is fixed in _INTENT_PROMPT_HEAD/TAIL.
+        intents_block, allowed_intents = self._intents_block(app_id, intents)
+        full_prompt = (
+            f"{_INTENT_PROMPT_HEAD}{app_id}\n"
+            "\n"
+            "Allowed intents (each line is one intent string):\n"
+            f"{intents_block}\n"
+            "\n"
+            "Recent conversation history (oldest to newest):\n"
+            f"{history_block}\n"
+            "\n"
+            "Current user request:\n"
+            f"{message}{_INTENT_PROMPT_TAIL}"
         )
+
+        return cache_key, full_prompt, allowed_intents
+
+    def _finish_match(
+        self,
+        cache_key: Tuple[Any, ...],
+        allowed_intents: FrozenSet[str],
+        result_model: IntentMatchResultModel,
+    ) -> IntentValidationResult:
+        """Turn GPT's structured answer into a result and memoize it."""
+        # Convert the Pydantic model into our dataclass. A "supported" answer
+        # naming anything but one of the allowed intents is rejected here, so
+        # a hallucinated intent never reaches the intent -> method map.
+        if (
+            result_model.is_supported
+            and result_model.matched_intent not in allowed_intents
+        ):
+            result = IntentValidationResult(
+                is_supported=False,
+                reason="OpenAI backend returned an intent that is not in the allowed list.",
+            )
+        else:
+            result = IntentValidationResult(
+                is_supported=result_model.is_supported,
+                matched_intent=result_model.matched_intent,
+                method_name=None,  # always resolved by server-side map, never by GPT
+                reason=result_model.reason,
+            )
+
+        self._match_cache[cache_key] = result
+        if len(self._match_cache) > _MATCH_CACHE_SIZE:
+            self._match_cache.popitem(last=False)
+        return result
@@ -119,4 +119,55 @@ details such as clicks, swipes, or findNode operations.
 
 Code:
 {code}
-"""
\ No newline at end of file
+"""
+
+
+# ----------------------------------------------------------------
+# Pre-split renderers
+# ----------------------------------------------------------------
+#
+# The templates above stay the single source of truth. The ones used by
+# skill_interpreter are split around their placeholders once at import, and
+# each render_* function pastes the values between the fixed pieces with one
+# f-string instead of re-parsing the template through str.format per call.
+# This also keeps literal JSON braces in a template (PROMPT_EXTRACT_PARAMETERS)
+# from being read as replacement fields.
+
+
+def _split_prompt(template: str, *placeholders: str) -> tuple[str, ...]:
+    """Split template around placeholders, which must appear once each, in order."""
+    parts = []
+    rest = template
+    for placeholder in placeholders:
+        head, sep, rest = rest.partition(placeholder)
+        if not sep:
+            raise ValueError(f"placeholder {placeholder!r} not found in prompt template")
+        parts.append(head)
+    parts.append(rest)
+    return tuple(parts)
+
+
+_EXTRACT_PARAMETERS_HEAD, _EXTRACT_PARAMETERS_TAIL = _split_prompt(
+    PROMPT_EXTRACT_PARAMETERS, "{code}"
+)
+_DETAIL_HEAD, _DETAIL_MID, _DETAIL_TAIL = _split_prompt(
+    PROMPT_DIRECT_INTENT_DETAIL, "{app_intro}", "{code}"
+)
+_SHORT_HEAD, _SHORT_MID, _SHORT_TAIL = _split_prompt(
+    PROMPT_DIRECT_INTENT_SHORT, "{app_intro}", "{code}"
+)
+
+
+def render_extract_parameters(code: str) -> str:
+    """Return PROMPT_EXTRACT_PARAMETERS filled in with code."""
+    return f"{_EXTRACT_PARAMETERS_HEAD}{code}{_EXTRACT_PARAMETERS_TAIL}"
+
+
+def render_direct_intent_detail(code: str, app_intro: str) -> str:
+    """Return PROMPT_DIRECT_INTENT_DETAIL filled in with app_intro and code."""
+    return f"{_DETAIL_HEAD}{app_intro}{_DETAIL_MID}{code}{_DETAIL_TAIL}"
+
+
+def render_direct_intent_short(code: str, app_intro: str) -> str:
+    """Return PROMPT_DIRECT_INTENT_SHORT filled in with app_intro and code."""
+    return f"{_SHORT_HEAD}{app_intro}{_SHORT_MID}{code}{_SHORT_TAIL}"
@@ -32,9 +32,9 @@ from typing import List, Dict, Optional
 from core.api.openai_client import send_request_to_gpt
 from .models import SkillSchema
 from .prompts import (
-    PROMPT_EXTRACT_PARAMETERS,
-    PROMPT_DIRECT_INTENT_DETAIL,
-    PROMPT_DIRECT_INTENT_SHORT,
+    render_extract_parameters,
+    render_direct_intent_detail,
+    render_direct_intent_short,
 )
 
 
@@ -119,7 +119,7 @@ def collect_parameters(va_code: str) -> List[str]:
     This logic is preserved for compatibility with earlier versions,
     but the results are NOT used in the final schema.
     """
-    prompt = PROMPT_EXTRACT_PARAMETERS.format(code=va_code)
+    prompt = render_extract_parameters(va_code)
     response = send_request_to_gpt(prompt, structured_output=True)
     data = json.loads(response)
     return data.get("parameters", [])
@@ -130,7 +130,7 @@ def generate_detailed_intent(va_code: str, app_intro: str) -> str:
     Produce a ≤20-word description of the method's user intent,
     using PROMPT_DIRECT_INTENT_DETAIL and app-level introduction.
     """
-    prompt = PROMPT_DIRECT_INTENT_DETAIL.format(
+    prompt = render_direct_intent_detail(
         code=va_code,
         app_intro=app_intro or "(No app introduction provided.)",
     )
@@ -142,7 +142,7 @@ def generate_short_intent(va_code: str, app_intro: str) -> str:
     Produce a ≤5-word short intent label,
     using PROMPT_DIRECT_INTENT_SHORT and app-level introduction.
     """
-    prompt = PROMPT_DIRECT_INTENT_SHORT.format(
+    prompt = render_direct_intent_short(
         code=va_code,
         app_intro=app_intro or "(No app introduction provided.)",
     )
@@ -0,0 +1,46 @@
+"""
+core.utils.fileio
+
+Small file helpers shared by the converter, the ActionPlan parser and the
+runtime stores.
+"""
+
+import hashlib
+import os
+import threading
+from types import ModuleType
+from typing import Iterable, Union
+
+
+def module_source_digest(modules: Iterable[ModuleType]) -> str:
+    """Return a BLAKE2b hex digest of the given modules' source files."""
+    h = hashlib.blake2b(digest_size=16)
+    for module in modules:
+        with open(module.__file__, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+
+def write_bytes_atomic(path: Union[str, "os.PathLike[str]"], data: bytes) -> None:
+    """
+    Write `data` to `path` via a temporary file in the same directory and
+    os.replace(), so readers never see a partially written file.
+
+    The temporary name includes the PID and the thread id because pool
+    workers and the session store's writer threads may write the same file
+    at the same time. Errors are re-raised after the temporary file is
+    removed; best-effort callers catch OSError themselves.
+    """
+    path = os.fspath(path)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
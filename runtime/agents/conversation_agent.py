@@ -14,14 +14,96 @@ Current behavior:
   simple clarification-style response.
 - always appends the server's response as another Turn
 - persists the updated Session via SessionStore
+
+The flow is async end to end: session I/O goes through the SessionStore's
+async methods, and GPT calls go through the AsyncOpenAI client (or a worker
+thread for validators without an async path), so one slow request does not
+hold up the others on the event loop.
 """
 
+import asyncio
+import re
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, List, Optional
 
 from ..models.api_models import AgentResponse
 from ..models.session_models import Session, Turn, SessionStatus
 
+# GPT helper for the summary classification, imported once. Optional, so
+# the agent still works (without summary detection) when the OpenAI
+# client cannot be set up.
+try:
+    from core.api.openai_client import async_send_request_to_gpt as _async_send_request_to_gpt
+except Exception:
+    _async_send_request_to_gpt = None
+
+
+# LRU of GPT summary-request classifications, keyed on the normalized
+# message: "what can you do?" style phrasings recur across sessions.
+_SUMMARY_CACHE_SIZE = 1024
+_SUMMARY_CLASSIFICATIONS: "OrderedDict[str, bool]" = OrderedDict()
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Cheap prefilter for summary requests: messages with none of these hints
+# (the bulk of traffic, i.e. concrete actions) skip the GPT classification.
+_SUMMARY_HINT_RE = re.compile(
+    r"\b(what (can|could|do|does) (you|this|i|the app)|intents?\b|capabilit|features?\b|help\b)",
+    re.IGNORECASE,
+)
+
+# Prompt for the summary-request classification; the user message goes
+# between head and tail.
+_SUMMARY_PROMPT_HEAD = (
+    "You classify whether a user message is asking about an app's capabilities\n"
+    "(its intents) or asking to perform a specific action.\n"
+    "\n"
+    "Examples that SHOULD be classified as YES (asking for a summary of intents):\n"
+    '- "What can you do?"\n'
+    '- "What can this app do?"\n'
+    '- "What can I do here?"\n'
+    '- "What can I ask?"\n'
+    '- "What are your intents?"\n'
+    '- "What intents are available?"\n'
+    '- "List intents."\n'
+    "\n"
+    "Examples that SHOULD be classified as NO (specific actions, not capability questions):\n"
+    '- "Open sleep statistics screen"\n'
+    '- "Delete all sleep entries"\n'
+    '- "Start tracking my sleep"\n'
+    "\n"
+    "User message:\n"
+)
+
+_SUMMARY_PROMPT_TAIL = (
+    "\n"
+    "\n"
+    "Answer with exactly one word: YES or NO."
+)
+
+# Most recent turns handed to the intent_validator as history. Validators
+# only look at the last few turns, so long sessions need not be copied whole.
+_VALIDATOR_HISTORY_TURNS = 16
+
+
+def _normalize_message(message: str) -> str:
+    """Lowercase a message and collapse its whitespace, for cache keys."""
+    return _WHITESPACE_RE.sub(" ", message.strip().lower())
+
+
+def _discard_task(task: Optional["asyncio.Future[Any]"]) -> None:
+    """Cancel a task whose result is no longer needed.
+
+    If it already finished, its exception (if any) is retrieved so asyncio
+    does not report it as never retrieved.
+    """
+    if task is None:
+        return
+    task.cancel()
+    task.add_done_callback(
+        lambda t: None if t.cancelled() else t.exception()
+    )
+
 
 class ConversationAgent:
     """Conversation + decision logic for AVA-Gen.
@@ -39,7 +121,8 @@ class ConversationAgent:
         supported intent and method_name. It is expected to expose:
 
             validate(app_id, message, history) -> result
-                where result has at least:
+                (or the coroutine avalidate with the same signature, which
+                is preferred when present) where result has at least:
                     - is_supported: bool
                     - matched_intent: Optional[str]
                     - method_name: Optional[str] (optional)
@@ -58,21 +141,34 @@ class ConversationAgent:
         self.log_store = log_store
         self.intent_validator = intent_validator
 
-    def handle_user_message(self, session_id: str, message: str) -> AgentResponse:
+    async def handle_user_message(
+        self,
+        session_id: str,
+        message: str,
+        session: Optional[Session] = None,
+    ) -> AgentResponse:
         """Handle a single user message within the given session.
 
+        A caller that has already loaded the session (e.g. the API route,
+        after checking app_id) passes it as ``session`` so the agent works
+        on that exact object instead of fetching it again.
+
         Flow:
-        - load Session from store
+        - load Session from store, unless one was passed in
         - append user Turn
-        - if an intent_validator is configured, attempt to use it to
-          decide between clarification vs. action_plan
+        - concurrently ask whether this is a request for the app's intent
+          summary and, if an intent_validator is configured, validate the
+          message; a summary request is answered with the summary
+        - otherwise use the validation result to decide between
+          clarification vs. action_plan
         - otherwise, or on failure, fall back to a simple clarification
         - append server Turn
         - save Session
         - return AgentResponse
         """
         # Load the current session from the session store.
-        session: Session | None = self.session_store.get_session(session_id)
+        if session is None:
+            session = await self.session_store.aget_session(session_id)
         if session is None:
             raise ValueError(f"Session not found: {session_id}")
 
@@ -87,26 +183,37 @@ class ConversationAgent:
         )
         session.turns.append(user_turn)
 
-        # (2) First, handle meta-requests asking for an intent summary, if possible.
-        # This uses GPT to classify whether the user is asking about the app's
-        # capabilities and, if so, returns the precomputed intent_summary.
-        summary_response: Optional[AgentResponse] = None
-        try:
-            summary_response = self._maybe_handle_intent_summary(session, message)
-        except Exception:
-            summary_response = None
+        # (2) Start the GPT work for both possible answers at once: the
+        # classification of meta-requests asking for the app's intent summary,
+        # and the intent validation. Neither touches the session; only the
+        # decision below appends the server turn.
+        summary = self._intent_summary_text(session)
+        summary_task = (
+            asyncio.ensure_future(self._is_intent_summary_request(message))
+            if summary
+            else None
+        )
+        validate_task = (
+            asyncio.ensure_future(
+                self._validate_message(
+                    session.app_id, message, session.turns[-_VALIDATOR_HISTORY_TURNS:]
+                )
+            )
+            if self.intent_validator is not None
+            else None
+        )
 
-        if summary_response is not None:
-            # Persist session (with the appended user + server turns) and return.
-            self.session_store.save_session(session)
-            return summary_response
+        # A confirmed summary request wins; the validation is then dropped.
+        if summary_task is not None and await summary_task:
+            _discard_task(validate_task)
+            response = self._respond_with_intent_summary(session, summary)
 
-        # (3) Try to handle with intent_validator if available.
-        # This is the main decision point: use the validator to determine if the message corresponds to a supported intent.
-        if self.intent_validator is not None:
+        # (3) Otherwise use the intent_validator result, if one is configured.
+        # This is the main decision point: the validator determines if the message corresponds to a supported intent.
+        elif validate_task is not None:
             try:
-                # Attempt to process the message via the intent validator.
-                response = self._handle_with_intent_validator(session, message)
+                result = await validate_task
+                response = await self._handle_with_intent_validator(session, message, result)
             except NotImplementedError:
                 # Validator not implemented yet; fall back to clarification response.
                 response = self._fallback_clarification(session, message)
@@ -118,7 +225,8 @@ class ConversationAgent:
             response = self._fallback_clarification(session, message)
 
         # (5) Persist updated session after appending both user and server turns.
-        self.session_store.save_session(session)
+        # This is the only save per request, whichever path produced the response.
+        await self.session_store.asave_session(session)
 
         # (6) Logging is done inside helpers; just return the response.
         return response
@@ -127,17 +235,10 @@ class ConversationAgent:
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _maybe_handle_intent_summary(
-        self,
-        session: Session,
-        message: str,
-    ) -> Optional[AgentResponse]:
+    def _intent_summary_text(self, session: Session) -> Optional[str]:
         """
-        Use GPT to decide whether the user is asking for a high-level
-        summary of what the app can do (its intents). If so, return an
-        AgentResponse with the precomputed intent_summary for this app.
-
-        If GPT classification fails or no summary is available, return None.
+        Return the precomputed intent_summary for the session's app, or None
+        if there is no app_id, no validator or no summary to offer.
         """
         app_id = session.app_id
         if not app_id or self.intent_validator is None:
@@ -151,59 +252,50 @@ class ConversationAgent:
             except Exception:
                 summary = None
 
-        if not summary:
-            return None
+        # Only a non-empty string can be sent back as the server turn.
+        return summary if isinstance(summary, str) and summary else None
 
-        # Lazy-import GPT helper to avoid hard dependency when OpenAI is not configured.
-        try:
-            from core.api.openai_client import send_request_to_gpt
-        except Exception:
-            return None
+    async def _is_intent_summary_request(self, message: str) -> bool:
+        """
+        Use GPT to decide whether the user is asking for a high-level
+        summary of what the app can do (its intents).
+
+        Messages without any summary hint are rejected without calling GPT.
+        If GPT classification fails or its answer is unclear, return False.
+        Answers are cached per normalized message; failures are not.
+        """
+        if not _SUMMARY_HINT_RE.search(message):
+            return False
+
+        key = _normalize_message(message)
+        cached = _SUMMARY_CLASSIFICATIONS.get(key)
+        if cached is not None:
+            _SUMMARY_CLASSIFICATIONS.move_to_end(key)
+            return cached
+
+        if _async_send_request_to_gpt is None:
+            return False
 
         # Ask GPT to classify whether this message is a capabilities / intents question.
-        classification_prompt_lines = [
-            "You classify whether a user message is asking about an app's capabilities",
-            "(its intents) or asking to perform a specific action.",
-            "",
-            "Examples that SHOULD be classified as YES (asking for a summary of intents):",
-            '- "What can you do?"',
-            '- "What can this app do?"',
-            '- "What can I do here?"',
-            '- "What can I ask?"',
-            '- "What are your intents?"',
-            '- "What intents are available?"',
-            '- "List intents."',
-            "",
-            "Examples that SHOULD be classified as NO (specific actions, not capability questions):",
-            '- "Open sleep statistics screen"',
-            '- "Delete all sleep entries"',
-            '- "Start tracking my sleep"',
-            "",
-            "User message:",
-            message,
-            "",
-            "Answer with exactly one word: YES or NO.",
-        ]
-        classification_prompt = "\n".join(classification_prompt_lines)
+        classification_prompt = _SUMMARY_PROMPT_HEAD + message + _SUMMARY_PROMPT_TAIL
 
         try:
-            raw = send_request_to_gpt(classification_prompt)
+            raw = await _async_send_request_to_gpt(classification_prompt)
         except Exception:
-            return None
+            return False
 
-        answer = (raw or "").strip().lower()
-        if answer.startswith("yes"):
-            is_summary_request = True
-        elif answer.startswith("no"):
-            is_summary_request = False
-        else:
-            # Unclear response; do not treat as a summary request.
-            return None
+        # Anything but a clear YES (NO, or an unclear response) is not
+        # treated as a summary request. Only the first three characters
+        # matter, so only those are lowercased.
+        is_summary = (raw or "").lstrip()[:3].lower() == "yes"
 
-        if not is_summary_request:
-            return None
+        _SUMMARY_CLASSIFICATIONS[key] = is_summary
+        if len(_SUMMARY_CLASSIFICATIONS) > _SUMMARY_CACHE_SIZE:
+            _SUMMARY_CLASSIFICATIONS.popitem(last=False)
+        return is_summary
 
-        # At this point we have both a summary request and a summary string.
+    def _respond_with_intent_summary(self, session: Session, summary: str) -> AgentResponse:
+        """Answer a summary request with the app's precomputed intent_summary."""
         server_turn = Turn(
             role="server",
             message=summary,
@@ -219,7 +311,7 @@ class ConversationAgent:
                     event_type="intent_summary",
                     payload={
                         "session_id": session.session_id,
-                        "app_id": app_id,
+                        "app_id": session.app_id,
                     },
                 )
             except Exception:
@@ -283,24 +375,43 @@ class ConversationAgent:
             next_session_id=None,
         )
 
-    def _handle_with_intent_validator(self, session: Session, message: str) -> AgentResponse:
-        """Use the configured intent_validator to decide the next action.
+    async def _validate_message(
+        self,
+        app_id: Optional[str],
+        message: str,
+        history: List[Turn],
+    ) -> Any:
+        """Run the intent_validator on a message, given a slice of recent turns.
+
+        Prefers the validator's async path; a sync-only validator runs in a
+        worker thread.
+        """
+        avalidate = getattr(self.intent_validator, "avalidate", None)
+        if avalidate is not None:
+            return await avalidate(app_id=app_id, message=message, history=history)
+        return await asyncio.to_thread(
+            self.intent_validator.validate,
+            app_id=app_id,
+            message=message,
+            history=history,
+        )
+
+    async def _handle_with_intent_validator(
+        self,
+        session: Session,
+        message: str,
+        result: Any,
+    ) -> AgentResponse:
+        """Use the intent_validator's result to decide the next action.
 
         High-level logic:
-        - call validator.validate(app_id, message, history=session.turns)
+        - result comes from validator.validate(app_id, message, history=session.turns)
         - if not supported -> clarification
         - if supported -> map intent to method_name, load ActionPlan,
           and return an action_plan response
         """
         app_id = session.app_id
 
-        # Call the validator to check if the message is supported and to identify the intent and method.
-        result = self.intent_validator.validate(
-            app_id=app_id,
-            message=message,
-            history=list(session.turns),  # pass a snapshot of turns
-        )
-
         # Extract relevant fields from the validation result.
         is_supported = getattr(result, "is_supported", False)
         matched_intent = getattr(result, "matched_intent", None)
@@ -462,7 +573,7 @@ class ConversationAgent:
         session.status = SessionStatus.ACTION_SENT
 
         # Create a new session for follow-up interactions with the same app.
-        next_session = self.session_store.create_session(app_id=app_id)
+        next_session = await self.session_store.acreate_session(app_id=app_id)
         next_session_id = next_session.session_id
 
         # Log the action plan selection event.
@@ -7,6 +7,12 @@ Responsibilities:
 - include session-related routes under /agent
 """
 
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+
 from fastapi import FastAPI
 
 from configs.settings import settings
@@ -20,15 +26,57 @@ from runtime.store.actionplan_store import ActionPlanStore
 from . import session_routes
 
 
+def _put_drop_oldest(q: "queue.Queue[object]", item: object) -> None:
+    """Put item on the bounded queue q, evicting the oldest entries if full."""
+    while True:
+        try:
+            q.put_nowait(item)
+            return
+        except queue.Full:
+            try:
+                q.get_nowait()
+            except queue.Empty:
+                pass
+            else:
+                # The evicted entry will never reach the listener; account
+                # for it so unfinished_tasks (and Queue.join) stay correct.
+                q.task_done()
+
+
+class _DropOldestQueueListener(logging.handlers.QueueListener):
+    """QueueListener whose stop() cannot fail on a full bounded queue.
+
+    The stock enqueue_sentinel uses put_nowait and raises queue.Full when
+    the queue is full; here the oldest record is dropped to make room.
+    """
+
+    def enqueue_sentinel(self) -> None:
+        _put_drop_oldest(self.queue, self._sentinel)
+
+
 class ConsoleLogStore:
     """Very small log sink used during local development / testing.
 
     For now this just prints events; it can later be replaced with a
     JSONL-based LogStore that writes to runtime/data/logs.
+
+    log_event only formats the line and puts it on a bounded queue; a
+    background QueueListener thread does the console writes, so requests
+    never wait on stdout. When the queue is full the oldest line is
+    dropped. Lines still queued at exit are flushed.
     """
 
+    def __init__(self, maxsize: int = 10_000) -> None:
+        self._queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize)
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        self._listener = _DropOldestQueueListener(self._queue, handler)
+        self._listener.start()
+        atexit.register(self._listener.stop)
+
     def log_event(self, event_type: str, payload: dict) -> None:
-        print(f"[LOG] {event_type}: {payload}")
+        record = logging.makeLogRecord({"msg": f"[LOG] {event_type}: {payload}"})
+        _put_drop_oldest(self._queue, record)
 
 
 # ---------------------------------------------------------------------------
@@ -40,6 +88,8 @@ session_store = SessionStore(data_dir=str(settings.runtime_data_dir))
 
 # ActionPlan storage: reads workspace/<app_id>/actionplan/<app_id>_actionplan.json
 actionplan_store = ActionPlanStore(workspace_root=str(settings.workspace_root))
+# Read every app's plans at startup so first requests do not wait on disk.
+actionplan_store.warmup()
 
 # Simple console logger for now.
 log_store = ConsoleLogStore()
@@ -67,7 +67,7 @@ async def start_session() -> StartSessionResponse:
     and initializing any in-memory / on-disk state.
     """
     session_store = _require_session_store()
-    session = session_store.create_session()
+    session = await session_store.acreate_session()
     return StartSessionResponse(session_id=session.session_id)
 
 
@@ -87,25 +87,27 @@ async def handle_request(request: AgentRequest) -> AgentResponse:
         session_store = _require_session_store()
         agent = _require_conversation_agent()
 
-        session = session_store.get_session(request.session_id)
+        session = await session_store.aget_session(request.session_id)
         if session is None:
             # Session not found for this session_id
             raise HTTPException(status_code=404, detail="Session not found")
 
         # Attach app_id to the session on first use, and enforce that it
-        # does not change across requests for the same session.
+        # does not change across requests for the same session. The session
+        # object is handed to the agent, which persists it (app_id included)
+        # with the request's turns.
         if session.app_id is None:
             session.app_id = request.app_id
-            session_store.save_session(session)
         elif session.app_id != request.app_id:
             raise HTTPException(
                 status_code=400,
                 detail="app_id does not match existing session",
             )
 
-        response = agent.handle_user_message(
+        response = await agent.handle_user_message(
             session_id=request.session_id,
             message=request.message,
+            session=session,
         )
         return response
 
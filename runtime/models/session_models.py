@@ -5,8 +5,14 @@ These describe:
 - a minimal Session object
 - Turn entries (user / server)
 - SessionStatus enum (OPEN, ACTION_SENT, CLOSED)
+
+Turn is a plain slots dataclass rather than a pydantic model: turns are
+only built internally by the agent, a few per request, so per-instance
+validation buys nothing. Session stays a pydantic model, which still
+validates turns (dicts -> Turn) when a session is loaded from disk.
 """
 
+from dataclasses import dataclass
 from enum import Enum
 from typing import List, Optional
 from datetime import datetime
@@ -19,7 +25,8 @@ class SessionStatus(str, Enum):
     CLOSED = "CLOSED"
 
 
-class Turn(BaseModel):
+@dataclass(slots=True)
+class Turn:
     role: str          # "user" or "server"
     message: str       # raw text
     type: Optional[str] = None  # "clarification", "action_plan", etc.
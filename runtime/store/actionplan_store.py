@@ -22,8 +22,44 @@ and hides the details of locating and parsing the per-app JSON files.
 """
 
 import json
+import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+
+# Step / matcher fields whose values come from a small fixed vocabulary
+# (action names, matcher types, match modes). json.load creates a fresh
+# string for every occurrence; interning them lets all cached plans share one
+# object per distinct value for the lifetime of the server.
+_INTERNED_FIELDS = ("action", "type", "mode")
+
+# Apps whose parsed plans are kept in memory; least recently used beyond this
+# are dropped and re-read from disk if requested again.
+_CACHE_SIZE = 32
+
+
+def _intern_vocabulary(obj: Dict[str, Any]) -> Dict[str, Any]:
+    """json object_hook that interns the vocabulary fields of each object."""
+    for key in _INTERNED_FIELDS:
+        value = obj.get(key)
+        if type(value) is str:
+            obj[key] = sys.intern(value)
+    return obj
+
+
+# (file signature, { method_name -> action_plan_dict }) for one app.
+_CacheEntry = Tuple[Optional[Tuple[int, int]], Dict[str, Any]]
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    """Return (st_mtime_ns, st_size) for path, or None if it cannot be stat'ed."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
 
 
 class ActionPlanStore:
@@ -43,16 +79,15 @@ class ActionPlanStore:
 
     def __init__(self, workspace_root: str = "workspace") -> None:
         self.workspace_root = Path(workspace_root)
-        # In-memory cache: app_id -> { method_name -> action_plan_dict }
-        self._cache: Dict[str, Dict[str, Any]] = {}
+        # Built once; _actionplan_path runs on every lookup.
+        self._actionplan_dir = self.workspace_root / "actionplan"
+        # In-memory LRU cache: app_id -> (file signature, { method_name -> action_plan_dict }).
+        # The signature is checked on every lookup, so edited files are re-read.
+        self._cache: "OrderedDict[str, _CacheEntry]" = OrderedDict()
 
     def _actionplan_path(self, app_id: str) -> Path:
         """Return the expected JSON path for the given app_id."""
-        return (
-            self.workspace_root
-            / "actionplan"
-            / f"{app_id}_actionplan.json"
-        )
+        return self._actionplan_dir / f"{app_id}_actionplan.json"
 
     def _load_app_plans(self, app_id: str) -> Dict[str, Any]:
         """Load and cache the action_plans dict for a given app_id.
@@ -66,17 +101,36 @@ class ActionPlanStore:
         ValueError
             If the JSON structure is missing required keys.
         """
-        if app_id in self._cache:
-            return self._cache[app_id]
-
         path = self._actionplan_path(app_id)
-        if not path.is_file():
+        signature = _file_signature(path)
+        cached = self._cache.get(app_id)
+        if cached is not None:
+            if cached[0] == signature:
+                self._cache.move_to_end(app_id)
+                return cached[1]
+            # The file changed (or is gone) since it was cached.
+            del self._cache[app_id]
+
+        if signature is None or not path.is_file():
             raise FileNotFoundError(
                 f"ActionPlan JSON not found for app_id={app_id}: {path}"
             )
 
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        return self._parse_app_plans(app_id, path.read_bytes(), signature)
+
+    def _parse_app_plans(
+        self,
+        app_id: str,
+        raw: bytes,
+        signature: Optional[Tuple[int, int]],
+    ) -> Dict[str, Any]:
+        """Parse an app's actionplan file contents, validate and cache them.
+
+        `signature` is the file's (mtime_ns, size), taken before it was
+        read. Raises ValueError like _load_app_plans if the structure is
+        invalid.
+        """
+        data = json.loads(raw.decode("utf-8"), object_hook=_intern_vocabulary)
 
         if not isinstance(data, dict):
             raise ValueError(
@@ -101,10 +155,54 @@ class ActionPlanStore:
                 f"Invalid 'action_plans' format for app_id={app_id}: expected object"
             )
 
+        # Method names repeat across apps (and reloads); share one str each.
+        action_plans = {sys.intern(k): v for k, v in action_plans.items()}
+
         # Cache and return
-        self._cache[app_id] = action_plans
+        self._cache[app_id] = (signature, action_plans)
+        if len(self._cache) > _CACHE_SIZE:
+            self._cache.popitem(last=False)
         return action_plans
 
+    def warmup(self, app_ids: Optional[Iterable[str]] = None) -> None:
+        """Load several apps' plans up front, reading their files in parallel.
+
+        Defaults to every `<app_id>_actionplan.json` in the actionplan
+        directory, up to the cache size. File reads overlap in a thread
+        pool; parsing stays sequential. Apps whose file is missing or
+        invalid are skipped here and raise on first use, as before.
+        """
+        if app_ids is None:
+            suffix = "_actionplan.json"
+            paths = sorted(self._actionplan_dir.glob(f"*{suffix}"))
+            app_ids = [p.name[: -len(suffix)] for p in paths]
+        pending = [a for a in dict.fromkeys(app_ids) if a not in self._cache]
+        pending = pending[:_CACHE_SIZE]
+        if not pending:
+            return
+
+        def read(app_id: str) -> Optional[Tuple[Tuple[int, int], bytes]]:
+            path = self._actionplan_path(app_id)
+            signature = _file_signature(path)
+            if signature is None:
+                return None
+            try:
+                return signature, path.read_bytes()
+            except OSError:
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(32, len(pending))) as pool:
+            contents = list(pool.map(read, pending))
+
+        for app_id, content in zip(pending, contents):
+            if content is None:
+                continue
+            signature, raw = content
+            try:
+                self._parse_app_plans(app_id, raw, signature)
+            except ValueError:
+                continue
+
     def get_actionplan(self, app_id: str, method_name: str) -> Optional[Dict[str, Any]]:
         """Return the action plan dict for the given app + method.
 
@@ -1,26 +1,102 @@
 """
 LogStore: append-only logging for AVA-Gen runtime events.
 
-This can write JSON lines to:
+This writes JSON lines to:
 
     runtime/data/logs/actions_YYYY-MM-DD.jsonl
 
-For now, this is a stub.
+log_event only enqueues the event; a background thread encodes queued
+events and appends them in batches, so callers never wait on disk.
 """
 
+import atexit
+import json
+import queue
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+# Most events encoded and written per batch.
+_BATCH_SIZE = 256
+
+# Queued item: (timestamp, event_type, payload), or None to stop the writer.
+_Event = Optional[Tuple[datetime, str, dict]]
+
 
 class LogStore:
-    """Simple logging abstraction (placeholder)."""
+    """Buffered JSONL event log, one file per UTC day."""
 
     def __init__(self, log_dir: str = "runtime/data/logs"):
         self.log_dir = log_dir
+        self._queue: "queue.SimpleQueue[_Event]" = queue.SimpleQueue()
+        self._files: Dict[str, BinaryIO] = {}
+        self._writer = threading.Thread(
+            target=self._run, name="LogStore-writer", daemon=True
+        )
+        self._writer.start()
+        atexit.register(self.close)
 
     def log_event(self, event_type: str, payload: dict) -> None:
         """
-        Append an event to a log file.
+        Append an event to the current day's log file.
 
-        TODO: implement date-based JSONL logging.
+        The event is queued and written by the background thread; the
+        payload should not be modified after this call.
         """
-        raise NotImplementedError
+        self._queue.put((datetime.now(timezone.utc), event_type, payload))
+
+    def close(self) -> None:
+        """Write all queued events, then stop the writer and close the files."""
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+
+    def _run(self) -> None:
+        """Writer thread: drain the queue in batches until close()."""
+        while True:
+            batch: List[_Event] = [self._queue.get()]
+            while len(batch) < _BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = None in batch
+            try:
+                self._write_batch([e for e in batch if e is not None])
+            except Exception:
+                # Logging is best effort; never let one bad batch stop the writer.
+                pass
+            if stop:
+                for f in self._files.values():
+                    f.close()
+                self._files.clear()
+                return
 
+    def _write_batch(self, events: List[Tuple[datetime, str, dict]]) -> None:
+        """Encode events and append them with one write per day file."""
+        lines_by_day: Dict[str, List[bytes]] = {}
+        for timestamp, event_type, payload in events:
+            record = {
+                "timestamp": timestamp.isoformat(),
+                "event_type": event_type,
+                "payload": payload,
+            }
+            line = json.dumps(record, ensure_ascii=False, default=str)
+            day = timestamp.date().isoformat()
+            lines_by_day.setdefault(day, []).append(line.encode("utf-8") + b"\n")
 
+        for day, lines in lines_by_day.items():
+            f = self._files.get(day)
+            if f is None:
+                # A new day: the previous day's file will not be written again.
+                for old in self._files.values():
+                    old.close()
+                self._files.clear()
+                log_dir = Path(self.log_dir)
+                log_dir.mkdir(parents=True, exist_ok=True)
+                f = open(log_dir / f"actions_{day}.jsonl", "ab")
+                self._files[day] = f
+            f.write(b"".join(lines))
+            f.flush()
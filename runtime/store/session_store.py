@@ -8,16 +8,32 @@ The design is intentionally simple:
 - If a data_dir is configured, sessions are also written to
   `data_dir/sessions/<session_id>.json` so that they can be reloaded
   on restart for debugging or replay.
+- The a* methods (acreate_session, aget_session, asave_session) are the
+  variants for async callers: they do the file I/O in a worker thread so
+  the event loop is not blocked on disk. Async saves of one session are
+  queued behind a single writer, which only writes the newest snapshot.
 """
 
-import json
+import asyncio
 from pathlib import Path
 from typing import Dict, Optional
 from uuid import uuid4
 
+from core.utils.fileio import write_bytes_atomic
+
 from ..models.session_models import Session
 
 
+def _encode_session(session: Session) -> bytes:
+    """Encode a session as indented UTF-8 JSON for its session file.
+
+    pydantic's encoder produces the same text as
+    json.dump(session.dict(), ensure_ascii=False, indent=2) did, several
+    times faster.
+    """
+    return session.model_dump_json(indent=2).encode("utf-8")
+
+
 class SessionStore:
     """In-memory + optional file-backed session store.
 
@@ -37,6 +53,10 @@ class SessionStore:
         # In-memory cache of sessions for fast access.
         self._sessions: Dict[str, Session] = {}
 
+        # Async writes: newest unwritten snapshot and running writer per session.
+        self._pending_writes: Dict[str, bytes] = {}
+        self._writers: Dict[str, "asyncio.Future[None]"] = {}
+
         # Optional base directory for persistence.
         self._data_dir: Optional[Path] = Path(data_dir) if data_dir else None
 
@@ -78,6 +98,12 @@ class SessionStore:
         self._persist_session(session)
         return session
 
+    async def acreate_session(self, app_id: Optional[str] = None) -> Session:
+        """Async variant of create_session; the file write runs in a thread."""
+        session = Session(session_id=str(uuid4()), app_id=app_id)
+        await self.asave_session(session)
+        return session
+
     def get_session(self, session_id: str) -> Optional[Session]:
         """Retrieve an existing session by ID.
 
@@ -93,23 +119,38 @@ class SessionStore:
 
         # 2) Attempt to load from disk if persistence is configured.
         if self._data_dir is not None:
+            # Read directly rather than is_file() first: a missing file
+            # costs one failed open instead of a stat plus an open.
             path = self._sessions_dir / f"{session_id}.json"
-            if path.is_file():
-                try:
-                    with path.open("r", encoding="utf-8") as f:
-                        data = json.load(f)
-                    session = Session(**data)
-                except Exception:
-                    # If loading fails for any reason, treat as not found.
-                    return None
-
-                # Cache in memory for subsequent access.
-                self._sessions[session_id] = session
-                return session
+            try:
+                raw = path.read_bytes()
+            except OSError:
+                return None
+            try:
+                session = Session.model_validate_json(raw)
+            except Exception:
+                # If loading fails for any reason, treat as not found.
+                return None
+
+            # Cache in memory for subsequent access. Concurrent cold loads
+            # (aget_session runs this in worker threads) may race here;
+            # setdefault keeps the first one so every caller shares it.
+            return self._sessions.setdefault(session_id, session)
 
         # 3) Not found anywhere.
         return None
 
+    async def aget_session(self, session_id: str) -> Optional[Session]:
+        """Async variant of get_session; a disk load runs in a thread.
+
+        Sessions already in memory are returned directly, without a thread
+        hop.
+        """
+        session = self._sessions.get(session_id)
+        if session is not None or self._data_dir is None:
+            return session
+        return await asyncio.to_thread(self.get_session, session_id)
+
     def save_session(self, session: Session) -> None:
         """Persist the given session in memory and to disk (if enabled).
 
@@ -119,6 +160,38 @@ class SessionStore:
         self._sessions[session.session_id] = session
         self._persist_session(session)
 
+    async def asave_session(self, session: Session) -> None:
+        """Async variant of save_session; the file write runs in a thread.
+
+        The session is serialized before the hand-off, so the
+        thread writes a snapshot even if the caller keeps changing the
+        session afterwards. Saves of the same session never write in
+        parallel: while one write is running, newer snapshots replace each
+        other and only the last is written next, so the file ends up with
+        the latest state and superseded snapshots are never written.
+        """
+        session_id = session.session_id
+        self._sessions[session_id] = session
+        if self._data_dir is None:
+            return
+
+        self._pending_writes[session_id] = _encode_session(session)
+        writer = self._writers.get(session_id)
+        if writer is None:
+            writer = asyncio.ensure_future(self._drain_writes(session_id))
+            self._writers[session_id] = writer
+        # Shielded: a cancelled caller must not abort a write others wait on.
+        await asyncio.shield(writer)
+
+    async def _drain_writes(self, session_id: str) -> None:
+        """Write pending snapshots of a session until none are left."""
+        try:
+            while session_id in self._pending_writes:
+                data = self._pending_writes.pop(session_id)
+                await asyncio.to_thread(self._write_session, session_id, data)
+        finally:
+            del self._writers[session_id]
+
     def _persist_session(self, session: Session) -> None:
         """Write the session to disk if a data_dir is configured.
 
@@ -128,9 +201,20 @@ class SessionStore:
             # No file-based persistence configured.
             return
 
-        sessions_dir = self._sessions_dir
-        sessions_dir.mkdir(parents=True, exist_ok=True)
-        path = sessions_dir / f"{session.session_id}.json"
+        self._write_session(session.session_id, _encode_session(session))
+
+    def _write_session(self, session_id: str, data: bytes) -> None:
+        """Write a session's encoded JSON to `<sessions_dir>/<session_id>.json`.
 
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(session.dict(), f, ensure_ascii=False, indent=2)
+        The write is atomic (see write_bytes_atomic), so a crash or a
+        concurrent get_session never sees a half-written file. The directory
+        is created in __init__; it is only re-created here if it has gone
+        missing since, rather than checked on every write.
+        """
+        sessions_dir = self._sessions_dir
+        path = sessions_dir / f"{session_id}.json"
+        try:
+            write_bytes_atomic(path, data)
+        except FileNotFoundError:
+            sessions_dir.mkdir(parents=True, exist_ok=True)
+            write_bytes_atomic(path, data)